@@ -1,7 +1,10 @@
 """
 Strands Analysis Agent - Main Agent Implementation
 """
+import ast
+import json
 import logging
+import re
 import asyncio
 import sys
 import os
@@ -28,6 +31,10 @@ from tools.analysis_tools import (
 
 logger = logging.getLogger(__name__)
 
+# Tool result text that is a serialized list/dict (leading/trailing whitespace allowed);
+# matched in place so plain text results are never copied by strip()
+_SERIALIZED_TEXT_RE = re.compile(r'\s*(?:\[.*\]|\{.*\})\s*\Z', re.DOTALL)
+
 class AnalysisAgent:
     """
     Strands SDK based Analysis Agent
@@ -398,13 +405,12 @@ class AnalysisAgent:
                         current_step += 1
                         tool_use_step = current_step
                     
-                    # Accumulate tool input
-                    if tool_input:
+                    # Accumulate tool input (no need to re-parse once the tool_use is emitted)
+                    if tool_input and not tool_use_yielded:
                         accumulated_tool_input = tool_input
                         
                         # Try to parse as JSON to see if complete
                         try:
-                            import json
                             parsed_input = json.loads(accumulated_tool_input)
                             
                             # Tool input is complete JSON, yield it if not already yielded
@@ -465,19 +471,18 @@ class AnalysisAgent:
                                         if isinstance(content_item, dict):
                                             # 1) detect special marker text
                                             if "text" in content_item and isinstance(content_item["text"], str):
-                                                text_val = content_item["text"].strip()
-                                                if text_val == "[[SEGMENT_IMAGE_URL]]":
-                                                    # marker: skip showing
-                                                    continue
-                                                # If text contains serialized list/dict, try to parse and extract signal
-                                                if (text_val.startswith("[") and text_val.endswith("]")) or (text_val.startswith("{") and text_val.endswith("}")):
+                                                # If text contains serialized list/dict (or the marker), try to parse and extract signal
+                                                if _SERIALIZED_TEXT_RE.match(content_item["text"]):
+                                                    text_val = content_item["text"].strip()
+                                                    if text_val == "[[SEGMENT_IMAGE_URL]]":
+                                                        # marker: skip showing
+                                                        continue
                                                     try:
-                                                        import json, ast as _ast
                                                         parsed = None
                                                         try:
                                                             parsed = json.loads(text_val)
                                                         except Exception:
-                                                            parsed = _ast.literal_eval(text_val)
+                                                            parsed = ast.literal_eval(text_val)
                                                         # normalize to list
                                                         parsed_items = parsed if isinstance(parsed, list) else [parsed]
                                                         for p in parsed_items:
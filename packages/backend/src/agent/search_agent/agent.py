@@ -3,7 +3,7 @@ Search Agent - Main Agent Implementation with Plan-Execute-Respond Pattern
 """
 import logging
 import asyncio
-import traceback
+import time
 from typing import Dict, Any, List, Optional, AsyncGenerator, Tuple
 from datetime import datetime
 from strands import Agent
@@ -13,6 +13,7 @@ from .prompt import prompt_manager
 from .conversation_manager import ConversationManager
 from .tools import hybrid_search
 from .workflow import PlannerAgent, ExecutorAgent, ResponderAgent, ImageAnalyzerAgent
+from .workflow.state import Plan
 
 logger = logging.getLogger(__name__)
 
@@ -61,7 +62,7 @@ class SearchAgent:
         self.responder = None
         self.image_analyzer_agent = None
 
-        logger.info(f"Initialized SearchAgent with model: {self.model_id}")
+        logger.info("Initialized SearchAgent with model: %s", self.model_id)
 
     async def startup(self):
         """Initialize and start the agent"""
@@ -75,7 +76,7 @@ class SearchAgent:
             tools = {
                 "hybrid_search": HybridSearchTool(verbose=True)
             }
-            logger.info(f"Tools initialized: {list(tools.keys())}")
+            logger.info("Tools initialized: %s", list(tools))
 
             # Initialize workflow agents
             logger.info("Initializing workflow agents...")
@@ -84,14 +85,13 @@ class SearchAgent:
             self.responder = ResponderAgent(model_id=self.model_id)
             self.image_analyzer_agent = ImageAnalyzerAgent(model_id=self.model_id)
             logger.info("Workflow agents initialized")
-            logger.info(f"Image analyzer agent initialized: {self.image_analyzer_agent is not None}")
+            logger.info("Image analyzer agent initialized: %s", self.image_analyzer_agent is not None)
 
             logger.info("SearchAgent startup completed successfully")
             return True
 
         except Exception as e:
-            logger.error(f"Failed to start agent: {e}")
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.exception("Failed to start agent: %s", e)
             raise
 
     async def shutdown(self):
@@ -99,7 +99,7 @@ class SearchAgent:
         try:
             logger.info("SearchAgent shutdown completed")
         except Exception as e:
-            logger.error(f"Error during shutdown: {e}")
+            logger.error("Error during shutdown: %s", e)
 
 
     async def ainvoke(
@@ -125,10 +125,9 @@ class SearchAgent:
         """
         try:
             # Format instruction with context
-            conversation_text = ""
-            if message_history:
-                for msg in message_history:
-                    conversation_text += f"{msg['role']}: {msg['content']}\n"
+            conversation_text = "\n".join(
+                f"{msg['role']}: {msg['content']}" for msg in message_history
+            ) if message_history else ""
 
             instruction = prompt_manager.format_instruction(
                 'orchestrator',
@@ -153,10 +152,7 @@ class SearchAgent:
                 response_text = str(result)
 
             # Update conversation history
-            updated_history = (message_history or []) + [
-                {"role": "user", "content": message},
-                {"role": "assistant", "content": response_text}
-            ]
+            updated_history = self._extend_history(message_history, message, response_text)
 
             return {
                 "response": response_text,
@@ -165,7 +161,7 @@ class SearchAgent:
             }
 
         except Exception as e:
-            logger.error(f"Error in ainvoke: {e}")
+            logger.error("Error in ainvoke: %s", e)
             return {
                 "response": f"Error: {str(e)}",
                 "references": [],
@@ -200,19 +196,20 @@ class SearchAgent:
             yield {
                 "type": "workflow_start",
                 "message": "Starting search workflow...",
-                "timestamp": datetime.now().timestamp()
+                "timestamp": time.time()
             }
 
             # Phase 0: Image Analysis (if files provided)
             enhanced_message = message
             if files and len(files) > 0:
-                logger.info(f"Phase 0: Analyzing {len(files)} image(s)")
-                logger.info(f"Files received: {[f.get('name') for f in files]}")
+                logger.info("Phase 0: Analyzing %d image(s)", len(files))
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Files received: %s", [f.get('name') for f in files])
                 yield {
                     "type": "phase_start",
                     "phase": "image_analysis",
                     "message": f"Analyzing {len(files)} image(s)...",
-                    "timestamp": datetime.now().timestamp()
+                    "timestamp": time.time()
                 }
 
                 # Use ImageAnalyzerAgent to analyze images
@@ -224,7 +221,7 @@ class SearchAgent:
                         "type": "image_analysis_complete",
                         "analysis": image_analysis,
                         "message": "Image analysis completed",
-                        "timestamp": datetime.now().timestamp()
+                        "timestamp": time.time()
                     }
 
                     # Enhance user message with image analysis
@@ -239,16 +236,16 @@ class SearchAgent:
                     yield {
                         "type": "image_analysis_skip",
                         "message": "No images to analyze or analysis failed",
-                        "timestamp": datetime.now().timestamp()
+                        "timestamp": time.time()
                     }
 
             # Format conversation history
-            conversation_text = ""
-            if message_history:
-                for msg in message_history:
-                    conversation_text += f"{msg['role']}: {msg['content']}\n"
+            conversation_text = "\n".join(
+                f"{msg['role']}: {msg['content']}" for msg in message_history
+            ) if message_history else ""
 
             # Tracking variables
+            response_parts = []
             full_response = ""
             collected_references = []
             plan = None
@@ -260,7 +257,7 @@ class SearchAgent:
                 "type": "phase_start",
                 "phase": "planning",
                 "message": "Analyzing request and creating execution plan...",
-                "timestamp": datetime.now().timestamp()
+                "timestamp": time.time()
             }
 
             # Use enhanced_message (with image analysis) for planning
@@ -274,14 +271,15 @@ class SearchAgent:
                 # Forward planning events
                 yield event
 
-                if event["type"] == "plan_complete":
+                event_type = event["type"]
+                if event_type == "plan_complete":
                     plan = event["plan"]
-                elif event["type"] == "planning_error":
+                elif event_type == "planning_error":
                     yield {
                         "type": "workflow_error",
                         "phase": "planning",
                         "error": event["error"],
-                        "timestamp": datetime.now().timestamp()
+                        "timestamp": time.time()
                     }
                     return
 
@@ -290,12 +288,11 @@ class SearchAgent:
                     "type": "workflow_error",
                     "phase": "planning",
                     "error": "Failed to generate plan",
-                    "timestamp": datetime.now().timestamp()
+                    "timestamp": time.time()
                 }
                 return
 
             # Convert plan dict to Plan object
-            from .workflow.state import Plan
             plan_obj = Plan.model_validate(plan)
 
             # Phase 2: Execution (if tools required)
@@ -305,7 +302,7 @@ class SearchAgent:
                     "type": "phase_start",
                     "phase": "execution",
                     "message": f"Executing {len(plan_obj.tasks)} tasks...",
-                    "timestamp": datetime.now().timestamp()
+                    "timestamp": time.time()
                 }
 
                 async for event in self.executor.astream(plan_obj):
@@ -322,7 +319,7 @@ class SearchAgent:
                     "type": "phase_skip",
                     "phase": "execution",
                     "message": "Using direct response, no tool execution needed",
-                    "timestamp": datetime.now().timestamp()
+                    "timestamp": time.time()
                 }
 
             # Phase 3: Response Generation
@@ -331,7 +328,7 @@ class SearchAgent:
                 "type": "phase_start",
                 "phase": "response",
                 "message": "Generating comprehensive response...",
-                "timestamp": datetime.now().timestamp()
+                "timestamp": time.time()
             }
 
             async for event in self.responder.astream(
@@ -346,23 +343,25 @@ class SearchAgent:
                 # Forward response events
                 yield event
 
-                if event["type"] == "response_token":
-                    full_response += event["token"]
-                elif event["type"] == "response_complete":
+                event_type = event["type"]
+                if event_type == "response_token":
+                    response_parts.append(event["token"])
+                elif event_type == "response_complete":
                     full_response = event["response"]
 
+            # Fall back to the streamed tokens if no response_complete arrived
+            if not full_response and response_parts:
+                full_response = "".join(response_parts)
+
             # Update conversation history
-            updated_history = (message_history or []) + [
-                {"role": "user", "content": message},
-                {"role": "assistant", "content": full_response}
-            ]
+            updated_history = self._extend_history(message_history, message, full_response)
 
             # Yield references if collected
             if collected_references:
                 yield {
                     "type": "references",
                     "references": collected_references,
-                    "timestamp": datetime.now().timestamp()
+                    "timestamp": time.time()
                 }
 
             # Yield workflow completion
@@ -372,19 +371,35 @@ class SearchAgent:
                 "references": collected_references,
                 "message_history": updated_history,
                 "message": "Workflow completed successfully",
-                "timestamp": datetime.now().timestamp()
+                "timestamp": time.time()
             }
 
         except Exception as e:
-            logger.error(f"Error in astream: {e}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.exception("Error in astream: %s", e)
             yield {
                 "type": "workflow_error",
                 "error": str(e),
-                "timestamp": datetime.now().timestamp()
+                "timestamp": time.time()
             }
 
+    @staticmethod
+    def _extend_history(
+        message_history: Optional[List[Dict[str, str]]],
+        user_message: str,
+        assistant_message: str
+    ) -> List[Dict[str, str]]:
+        """
+        Return a copy of the conversation history with a new user/assistant turn
+
+        The caller's list is not modified (the router keeps it per thread).
+        """
+        updated_history = list(message_history) if message_history else []
+        updated_history += (
+            {"role": "user", "content": user_message},
+            {"role": "assistant", "content": assistant_message}
+        )
+        return updated_history
+
     async def health_check(self) -> Dict[str, Any]:
         """
         Check health status of agent components
@@ -395,7 +410,7 @@ class SearchAgent:
         status = {
             "agent": True,
             "model": self.model_id,
-            "timestamp": datetime.now().timestamp()
+            "timestamp": time.time()
         }
 
         return status
@@ -2,17 +2,23 @@
 Prompt management for Search Agent
 """
 import os
+import re
 import yaml
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
+# {{VARIABLE}} placeholder; re.split with the capture group yields
+# [literal, name, literal, name, ..., literal]
+_PLACEHOLDER_RE = re.compile(r'{{(\w+)}}')
+
 class PromptManager:
     """Manager for loading and processing YAML prompts"""
 
     def __init__(self, reload: bool = False):
         self.prompt_dir = Path(__file__).parent
         self.prompt_cache = {} if reload else {}
+        self._template_cache: Dict[Tuple[str, str], List[str]] = {}
         self._load_prompts()
 
     def _load_prompts(self):
@@ -28,6 +34,25 @@ class PromptManager:
         """Get a specific prompt by name"""
         return self.prompt_cache.get(name)
 
+    def _render(self, name: str, field: str, template: str, variables: Dict[str, Any]) -> str:
+        """Render a prompt field from its pre-split fragments (split once per field)"""
+        key = (name, field)
+        fragments = self._template_cache.get(key)
+        if fragments is None:
+            fragments = _PLACEHOLDER_RE.split(template)
+            self._template_cache[key] = fragments
+
+        parts = []
+        for i, fragment in enumerate(fragments):
+            if i % 2 == 0:
+                parts.append(fragment)
+            elif fragment in variables:
+                parts.append(str(variables[fragment]))
+            else:
+                # Unknown placeholder is left as-is
+                parts.append(f'{{{{{fragment}}}}}')
+        return "".join(parts)
+
     def format_system_prompt(
         self,
         name: str,
@@ -50,10 +75,7 @@ class PromptManager:
             default_vars.update(variables)
 
         # Replace variables in prompt
-        for key, value in default_vars.items():
-            system_prompt = system_prompt.replace(f'{{{{{key}}}}}', str(value))
-
-        return system_prompt
+        return self._render(name, 'system_prompt', system_prompt, default_vars)
 
     def format_instruction(
         self,
@@ -84,10 +106,7 @@ class PromptManager:
             default_vars.update(variables)
 
         # Replace variables in instruction
-        for key, value in default_vars.items():
-            instruction = instruction.replace(f'{{{{{key}}}}}', str(value))
-
-        return instruction
+        return self._render(name, 'instruction', instruction, default_vars)
 
 # Global prompt manager instance
 prompt_manager = PromptManager()
@@ -2,9 +2,22 @@
 Base classes for tools in the search agent
 """
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional, TypedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, TypedDict, TypeVar
+import asyncio
+import functools
 import hashlib
 
+T = TypeVar("T")
+
+# Dedicated pool for blocking tool I/O so concurrent plan tasks do not
+# compete with other users of the event loop's default executor
+TOOL_THREAD_POOL_SIZE = 16
+_tool_thread_pool = ThreadPoolExecutor(
+    max_workers=TOOL_THREAD_POOL_SIZE,
+    thread_name_prefix="search-tool"
+)
+
 
 class Reference(TypedDict, total=False):
     """Reference information structure"""
@@ -34,6 +47,9 @@ class ToolResult(TypedDict):
 class BaseTool(ABC):
     """Base class for all tools"""
 
+    # Set to True on tools whose identical calls within a plan must each run separately
+    no_cache: bool = False
+
     def __init__(self, verbose: bool = False):
         self.verbose = verbose
 
@@ -70,6 +86,20 @@ class BaseTool(ABC):
         """
         pass
 
+    async def run_blocking(self, func: Callable[..., T], *args, **kwargs) -> T:
+        """
+        Run a blocking callable on the tool thread pool
+
+        Args:
+            func: Blocking function (e.g. an HTTP call)
+            *args, **kwargs: Arguments for func
+
+        Returns:
+            The return value of func
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_tool_thread_pool, functools.partial(func, *args, **kwargs))
+
     def create_reference(
         self,
         ref_type: str,
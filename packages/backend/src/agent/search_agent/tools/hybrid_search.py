@@ -4,7 +4,7 @@ Hybrid Search Tool - Combines semantic and keyword search
 import uuid
 import requests
 import logging
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 
 from .base import BaseTool, ToolResult, Reference
 from ..config import config
@@ -15,6 +15,9 @@ logger = logging.getLogger(__name__)
 # Get API base URL from config
 API_BASE_URL = config.api_base_url
 
+# Result fields that may hold the segment text, in priority order
+_CONTENT_FIELDS = ('content_combined', 'content', 'text', 'segment_content', 'page_content')
+
 
 class HybridSearchTool(BaseTool):
     """
@@ -45,6 +48,14 @@ class HybridSearchTool(BaseTool):
             "This search combines vector similarity with keyword matching for better results."
         )
 
+    @staticmethod
+    def _post_search(url: str, payload: Dict[str, Any]) -> Tuple[int, Optional[Dict[str, Any]]]:
+        """POST the search request and decode the JSON body (blocking; run in a worker thread)"""
+        response = requests.post(url, json=payload, timeout=30)
+        if response.status_code != 200:
+            return response.status_code, None
+        return response.status_code, response.json()
+
     async def execute(
         self,
         query: str,
@@ -86,13 +97,12 @@ class HybridSearchTool(BaseTool):
                 "size": size
             }
 
-            response = requests.post(url, json=payload, timeout=30)
+            # HTTP call and JSON decoding both run off the event loop
+            status_code, api_response = await self.run_blocking(self._post_search, url, payload)
 
-            if response.status_code != 200:
-                return self.create_error_result(f"Search API failed: HTTP {response.status_code}")
+            if status_code != 200:
+                return self.create_error_result(f"Search API failed: HTTP {status_code}")
 
-            # Get API response
-            api_response = response.json()
             if session_id:
                 api_response['_session_id'] = session_id
 
@@ -114,21 +124,15 @@ class HybridSearchTool(BaseTool):
             result_texts = []
 
             for idx, result in enumerate(results, 1):
-                # Get content from various possible fields
-                content = (
-                    result.get('content_combined', '') or
-                    result.get('content', '') or
-                    result.get('text', '') or
-                    result.get('segment_content', '') or
-                    result.get('page_content', '') or
-                    ''
-                )
+                # Get content from the first non-empty field
+                content = next((result[field] for field in _CONTENT_FIELDS if result.get(field)), '')
 
                 doc_id = result.get('document_id', 'unknown')
                 page_idx = result.get('page_index', 0)
                 segment_idx = result.get('segment_index', page_idx)
                 score = result.get('score', 0)
                 file_name = result.get('file_name', 'Unknown')
+                segment_label = f"{file_name} - Segment {segment_idx + 1}"
 
                 # Create processed result
                 processed_result = {
@@ -146,7 +150,7 @@ class HybridSearchTool(BaseTool):
                 ref = self.create_reference(
                     ref_type="document",
                     value=f"{doc_id}_{segment_idx}",
-                    title=f"{file_name} - Segment {segment_idx + 1}",
+                    title=segment_label,
                     description=f"Score: {score:.3f}",
                     document_id=doc_id,
                     file_name=file_name,
@@ -159,13 +163,13 @@ class HybridSearchTool(BaseTool):
                 # Build result text
                 if content:
                     result_texts.append(
-                        f"[Result {idx}] {file_name} - Segment {segment_idx + 1}\n"
+                        f"[Result {idx}] {segment_label}\n"
                         f"(Score: {score:.3f})\n"
                         f"Content: {content}"
                     )
                 else:
                     result_texts.append(
-                        f"[Result {idx}] {file_name} - Segment {segment_idx + 1}\n"
+                        f"[Result {idx}] {segment_label}\n"
                         f"(Score: {score:.3f})\n"
                         f"Document ID: {doc_id}, Page: {page_idx}"
                     )
@@ -174,9 +178,12 @@ class HybridSearchTool(BaseTool):
 
             # Also add formatted references from response
             formatted_refs = formatted.get('references', [])
+            seen_ids = {r.get('id') for r in references}
             for ref in formatted_refs:
                 # Check if reference already exists
-                if not any(r.get('id') == ref.get('id') for r in references):
+                ref_id = ref.get('id')
+                if ref_id not in seen_ids:
+                    seen_ids.add(ref_id)
                     references.append(ref)
 
             # Return standardized result
@@ -2,10 +2,16 @@
 Standardized response formatter for Search Agent
 Adapted from MCP server response_formatter.py
 """
+import logging
 import uuid
 from typing import Dict, Any, List, Optional
 from urllib.parse import unquote
 
+logger = logging.getLogger(__name__)
+
+# Result fields that may hold the source file name, in priority order
+_FILE_NAME_FIELDS = ('file_name', 'filename', 'name', 'document_name')
+
 
 class ResponseFormatter:
     """Response formatter for creating standardized responses with references"""
@@ -60,7 +66,7 @@ class ResponseFormatter:
             if tool_name == 'hybrid_search':
                 references = self._create_search_references(api_response, session_id)
         except Exception as e:
-            print(f"Error occurred during references creation: {str(e)}")
+            logger.error("Error occurred during references creation: %s", e)
 
         return references
 
@@ -80,25 +86,24 @@ class ResponseFormatter:
                 return references
 
             # Session-based duplicate prevention
-            session_key = session_id or 'default'
-            if session_key not in self.session_cache:
-                self.session_cache[session_key] = set()
+            seen_page_ids = self.session_cache.setdefault(session_id or 'default', set())
+            create_reference = self._create_search_image_reference
 
             for result in results:
                 if isinstance(result, dict):
                     # Check for duplicates
                     page_id = result.get('page_id', '')
-                    if page_id and page_id in self.session_cache[session_key]:
+                    if page_id and page_id in seen_page_ids:
                         continue
 
-                    image_ref = self._create_search_image_reference(result)
+                    image_ref = create_reference(result)
                     if image_ref:
                         references.append(image_ref)
                         if page_id:
-                            self.session_cache[session_key].add(page_id)
+                            seen_page_ids.add(page_id)
 
         except Exception as e:
-            print(f"Error occurred during search references creation: {str(e)}")
+            logger.error("Error occurred during search references creation: %s", e)
 
         return references
 
@@ -112,13 +117,10 @@ class ResponseFormatter:
 
             page_index = result.get('page_index', 0)
             segment_index = result.get('segment_index', page_index)
+            document_id = result.get('document_id', '')
 
-            # Extract file name from various possible fields
-            file_name = (result.get('file_name', '') or
-                        result.get('filename', '') or
-                        result.get('name', '') or
-                        result.get('document_name', '') or
-                        'Unknown File')
+            # Extract file name from the first non-empty field
+            file_name = next((result[field] for field in _FILE_NAME_FIELDS if result.get(field)), 'Unknown File')
 
             reference = {
                 'type': 'image',
@@ -131,7 +133,7 @@ class ResponseFormatter:
                 'value': image_uri,
                 'image_uri': image_uri,
                 'page_id': result.get('page_id', ''),
-                'document_id': result.get('document_id', ''),
+                'document_id': document_id,
                 'project_id': result.get('project_id', ''),
                 'score': result.get('score', 0),
             }
@@ -141,7 +143,7 @@ class ResponseFormatter:
             if file_uri:
                 reference['file_uri'] = file_uri
                 reference['linked_document'] = {
-                    'document_id': result.get('document_id', ''),
+                    'document_id': document_id,
                     'file_name': file_name,
                     'file_uri': file_uri
                 }
@@ -157,7 +159,7 @@ class ResponseFormatter:
             return reference
 
         except Exception as e:
-            print(f"Error occurred during search image reference creation: {str(e)}")
+            logger.error("Error occurred during search image reference creation: %s", e)
             return None
 
 
@@ -1,15 +1,23 @@
 """
 Executor Agent - Executes tasks from the plan
 """
+import asyncio
+import json
 import logging
 import time
-from typing import Dict, Any, AsyncIterator, List
+from typing import Dict, Any, AsyncIterator, List, Optional, Tuple
 
 from .state import Plan, Task, TaskStatus
-from ..tools.base import BaseTool
+from ..tools.base import BaseTool, ToolResult
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on tool calls running at the same time
+MAX_CONCURRENT_TASKS = 4
+
+# (executed task info, references) reported by a finished task
+TaskOutcome = Tuple[Dict[str, Any], List[Dict[str, Any]]]
+
 
 class ExecutorAgent:
     """
@@ -25,6 +33,11 @@ class ExecutorAgent:
         """
         self.tools = tools or {}
 
+    @staticmethod
+    def _tool_cache_key(tool_name: str, tool_args: Dict[str, Any]) -> str:
+        """Build a canonical cache key for a tool call"""
+        return json.dumps([tool_name, tool_args], sort_keys=True, default=str)
+
     async def astream(
         self,
         plan: Plan
@@ -47,28 +60,124 @@ class ExecutorAgent:
             }
             return
 
-        logger.info(f"Executing {len(plan.tasks)} tasks...")
+        logger.info("Executing %d tasks...", len(plan.tasks))
 
-        executed_tasks = []
-        all_references = []
+        # Plan tasks are independent tool calls, so they run concurrently. Each task
+        # reports its start/finish events through the queue once it actually runs.
+        events: "asyncio.Queue[Tuple[Dict[str, Any], Optional[TaskOutcome]]]" = asyncio.Queue()
 
-        for i, task in enumerate(plan.tasks):
-            task_start_time = time.time()
+        # Identical tool calls share one execution within this request only, so a
+        # new request always sees the current index contents
+        tool_calls: "Dict[str, asyncio.Task[ToolResult]]" = {}
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_TASKS)
+        pending = [
+            asyncio.create_task(self._run_task(i, task, tool_calls, semaphore, events))
+            for i, task in enumerate(plan.tasks)
+        ]
 
-            # Update task status
-            task.status = TaskStatus.EXECUTING
+        # Results are kept in plan order for the responder
+        task_infos: List[Optional[Dict[str, Any]]] = [None] * len(pending)
+        task_references: List[List[Dict[str, Any]]] = [[] for _ in pending]
+        successful_count = 0
+        finished_count = 0
 
-            yield {
-                "type": "task_start",
-                "task_index": i,
-                "task": task.model_dump(),
-                "message": f"Executing: {task.title}",
-                "timestamp": time.time()
-            }
+        try:
+            while finished_count < len(pending):
+                event, outcome = await events.get()
+                if outcome is not None:
+                    executed_task_info, references = outcome
+                    i = event["task_index"]
+                    task_infos[i] = executed_task_info
+                    task_references[i] = references
+                    successful_count += executed_task_info["success"]
+                    finished_count += 1
+                yield event
+        finally:
+            # Stream closed early (e.g. client disconnect)
+            for pending_task in pending:
+                pending_task.cancel()
+
+        executed_tasks = task_infos
+        all_references = self._dedupe_references(task_references)
+
+        # Summary
+        logger.info("Execution complete: %d/%d successful", successful_count, len(executed_tasks))
+
+        yield {
+            "type": "execution_complete",
+            "total_tasks": len(executed_tasks),
+            "successful_tasks": successful_count,
+            "failed_tasks": len(executed_tasks) - successful_count,
+            "executed_tasks": executed_tasks,
+            "all_references": all_references,
+            "message": f"Execution complete: {successful_count}/{len(executed_tasks)} successful",
+            "timestamp": time.time()
+        }
+
+    @staticmethod
+    def _dedupe_references(task_references: List[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Merge per-task references in plan order, dropping pages already referenced by an earlier task"""
+        seen = set()
+        merged = []
+        for references in task_references:
+            for ref in references:
+                document_id = ref.get("document_id")
+                if document_id:
+                    key = (ref.get("type"), document_id, ref.get("segment_index"), ref.get("page_index"))
+                else:
+                    key = (ref.get("type"), ref.get("value"))
+                if key in seen:
+                    continue
+                seen.add(key)
+                merged.append(ref)
+        return merged
+
+    @staticmethod
+    def _task_snapshot(task_base: Dict[str, Any], task: Task) -> Dict[str, Any]:
+        """Overlay the execution fields on the task_start dump instead of dumping the task again"""
+        return {
+            **task_base,
+            "status": task.status,
+            "result": task.result,
+            "execution_time": task.execution_time
+        }
 
+    async def _run_task(
+        self,
+        i: int,
+        task: Task,
+        tool_calls: "Dict[str, asyncio.Task[ToolResult]]",
+        semaphore: asyncio.Semaphore,
+        events: "asyncio.Queue[Tuple[Dict[str, Any], Optional[TaskOutcome]]]"
+    ):
+        """
+        Execute a single task once a concurrency slot is free
+
+        Puts (task_start event, None) on the queue when the task starts running, then
+        (completion/failure event, (executed task info, references)) when it finishes.
+        """
+        async with semaphore:
+            task_start_time = time.monotonic()
+            task_base = None
+            cache_hit = False
+            references = []
+
+            # Everything runs inside the try so a finish event is always queued;
+            # astream waits for one per task
             try:
+                # The task is dumped once here; later events only overlay the fields that change
+                task.status = TaskStatus.EXECUTING
+                task_base = task.model_dump()
+                events.put_nowait(({
+                    "type": "task_start",
+                    "task_index": i,
+                    "task": task_base,
+                    "message": f"Executing: {task.title}",
+                    "timestamp": time.time()
+                }, None))
+
                 # Execute tool
-                logger.info(f"Executing task: {task.title} with tool: {task.tool_name}")
+                logger.info("Executing task: %s with tool: %s", task.title, task.tool_name)
 
                 # Get tool from registry
                 tool = self.tools.get(task.tool_name)
@@ -77,91 +186,95 @@ class ExecutorAgent:
                     # Unknown tool
                     task.status = TaskStatus.FAILED
                     task.result = f"Unknown tool: {task.tool_name}"
-                    task.execution_time = time.time() - task_start_time
-                    logger.error(f"Tool not found: {task.tool_name}")
+                    logger.error("Tool not found: %s", task.tool_name)
                 else:
-                    # Execute tool using BaseTool interface
-                    tool_result = await tool.execute(**task.tool_args)
-
-                    # Process standardized ToolResult
-                    references = []
+                    if tool.no_cache:
+                        # Execute tool using BaseTool interface
+                        tool_result = await tool.execute(**task.tool_args)
+                    else:
+                        # Identical calls (finished or still running) share one execution;
+                        # the executor only reads tool results, so they are not copied
+                        cache_key = self._tool_cache_key(task.tool_name, task.tool_args)
+                        tool_call = tool_calls.get(cache_key)
+                        cache_hit = tool_call is not None
+                        if tool_call is None:
+                            tool_call = asyncio.create_task(tool.execute(**task.tool_args))
+                            tool_calls[cache_key] = tool_call
+                        tool_result = await tool_call
 
                     if tool_result["success"]:
                         # Success case
                         task.status = TaskStatus.COMPLETED
                         task.result = tool_result["llm_text"] or "Task completed"
-                        task.execution_time = time.time() - task_start_time
 
                         # Collect references
                         references = tool_result.get("references", [])
-                        all_references.extend(references)
 
-                        logger.info(f"Tool executed successfully: {tool_result['count']} results")
+                        logger.info("Tool executed successfully: %s results (cache_hit=%s)", tool_result['count'], cache_hit)
 
                     else:
                         # Error case
                         error_msg = tool_result.get("error", "Unknown error")
                         task.status = TaskStatus.FAILED
                         task.result = error_msg
-                        task.execution_time = time.time() - task_start_time
-                        logger.error(f"Tool execution failed: {error_msg}")
+                        logger.error("Tool execution failed: %s", error_msg)
+
+                # Duration from the monotonic clock; the event timestamp stays wall-clock
+                task.execution_time = time.monotonic() - task_start_time
 
-                # Store execution info (convert task to dict for serialization)
+                # Store execution info (task as a dict for serialization)
+                task_dict = self._task_snapshot(task_base, task)
                 executed_task_info = {
-                    "task": task.model_dump(),  # Convert to dict
+                    "task": task_dict,
                     "success": task.status == TaskStatus.COMPLETED,
                     "execution_time": task.execution_time
                 }
-                executed_tasks.append(executed_task_info)
 
-                logger.info(f"Task completed in {task.execution_time:.2f}s")
+                logger.info("Task completed in %.2fs", task.execution_time)
 
-                yield {
+                event = {
                     "type": "task_complete",
                     "task_index": i,
-                    "task": task.model_dump(),
+                    "task": task_dict,
                     "references": references,
                     "execution_time": task.execution_time,
+                    "cache_hit": cache_hit,
                     "message": f"Completed: {task.title}",
                     "timestamp": time.time()
                 }
 
             except Exception as e:
-                logger.error(f"Task execution failed: {e}")
+                logger.error("Task execution failed: %s", e)
 
                 task.status = TaskStatus.FAILED
                 task.result = str(e)
-                task.execution_time = time.time() - task_start_time
+                task.execution_time = time.monotonic() - task_start_time
+                references = []
 
+                # Failed before the task_start dump: fall back to the plain task fields
+                if task_base is None:
+                    task_base = {
+                        "title": task.title,
+                        "tool_name": task.tool_name,
+                        "tool_args": task.tool_args,
+                        "description": task.description
+                    }
+                task_dict = self._task_snapshot(task_base, task)
                 executed_task_info = {
-                    "task": task.model_dump(),  # Convert to dict
+                    "task": task_dict,
                     "success": False,
                     "execution_time": task.execution_time,
                     "error": str(e)
                 }
-                executed_tasks.append(executed_task_info)
 
-                yield {
+                event = {
                     "type": "task_failed",
                     "task_index": i,
-                    "task": task.model_dump(),
+                    "task": task_dict,
                     "error": str(e),
                     "execution_time": task.execution_time,
                     "message": f"Failed: {task.title}",
                     "timestamp": time.time()
                 }
 
-        # Summary
-        successful_count = sum(1 for task_info in executed_tasks if task_info["success"])
-        logger.info(f"Execution complete: {successful_count}/{len(executed_tasks)} successful")
-
-        yield {
-            "type": "execution_complete",
-            "total_tasks": len(executed_tasks),
-            "successful_tasks": successful_count,
-            "failed_tasks": len(executed_tasks) - successful_count,
-            "executed_tasks": executed_tasks,
-            "all_references": all_references,
-            "message": f"Execution complete: {successful_count}/{len(executed_tasks)} successful",
-            "timestamp": time.time()
-        }
+            events.put_nowait((event, (executed_task_info, references)))
@@ -4,6 +4,7 @@ Planner Agent - Creates execution plans
 import json
 import logging
 import re
+import time
 from typing import Dict, Any, AsyncIterator
 from datetime import datetime
 from strands import Agent
@@ -14,6 +15,15 @@ from ..config import config
 
 logger = logging.getLogger(__name__)
 
+# planning_token events carry up to this many model chunks, or whatever arrived
+# within the flush interval; the frontend concatenates tokens, so batching is transparent
+PLANNING_TOKEN_BATCH = 16
+PLANNING_TOKEN_FLUSH_INTERVAL = 0.05  # seconds
+
+# Plan JSON extraction patterns (fenced block first, then any object)
+_FENCED_JSON_RE = re.compile(r'```json\s*(\{.*?\})\s*```', re.DOTALL)
+_JSON_OBJECT_RE = re.compile(r'\{.*\}', re.DOTALL)
+
 
 class PlannerAgent:
     """
@@ -87,41 +97,52 @@ class PlannerAgent:
             yield {
                 "type": "planning_start",
                 "message": "Analyzing request and creating execution plan...",
-                "timestamp": datetime.now().timestamp()
+                "timestamp": time.time()
             }
 
-            # Stream planning tokens
-            planning_text = ""
+            # Stream planning tokens in small batches
+            planning_parts = []
+            pending = []
+            last_flush = time.monotonic()
             async for event in self.agent.stream_async(instruction):
                 # Handle different event types
                 if "data" in event:
                     token = event["data"]
-                    if token:
-                        planning_text += token
-                        yield {
-                            "type": "planning_token",
-                            "token": token,
-                            "timestamp": datetime.now().timestamp()
-                        }
                 elif "content_delta" in event:
-                    delta = event["content_delta"]
-                    token = delta.get("text", "")
-                    if token:
-                        planning_text += token
-                        yield {
-                            "type": "planning_token",
-                            "token": token,
-                            "timestamp": datetime.now().timestamp()
-                        }
+                    token = event["content_delta"].get("text", "")
+                else:
+                    continue
+                if not token:
+                    continue
+
+                planning_parts.append(token)
+                pending.append(token)
+                now = time.monotonic()
+                if len(pending) >= PLANNING_TOKEN_BATCH or now - last_flush >= PLANNING_TOKEN_FLUSH_INTERVAL:
+                    yield {
+                        "type": "planning_token",
+                        "token": "".join(pending),
+                        "timestamp": time.time()
+                    }
+                    pending.clear()
+                    last_flush = now
+
+            if pending:
+                yield {
+                    "type": "planning_token",
+                    "token": "".join(pending),
+                    "timestamp": time.time()
+                }
 
             # Parse planning text to extract JSON
+            planning_text = "".join(planning_parts)
             plan = self._parse_plan(planning_text, index_id)
 
             # Yield plan complete
             yield {
                 "type": "plan_complete",
                 "plan": plan.model_dump(),
-                "timestamp": datetime.now().timestamp()
+                "timestamp": time.time()
             }
 
         except Exception as e:
@@ -129,19 +150,19 @@ class PlannerAgent:
             yield {
                 "type": "planning_error",
                 "error": str(e),
-                "timestamp": datetime.now().timestamp()
+                "timestamp": time.time()
             }
 
     def _parse_plan(self, planning_text: str, index_id: str) -> Plan:
         """Parse planning text to extract Plan object"""
         try:
             # Extract JSON from text (handle markdown code blocks)
-            json_match = re.search(r'```json\s*(\{.*?\})\s*```', planning_text, re.DOTALL)
+            json_match = _FENCED_JSON_RE.search(planning_text)
             if json_match:
                 json_str = json_match.group(1)
             else:
                 # Try to find any JSON object
-                json_match = re.search(r'\{.*\}', planning_text, re.DOTALL)
+                json_match = _JSON_OBJECT_RE.search(planning_text)
                 if json_match:
                     json_str = json_match.group(0)
                 else:
@@ -157,11 +178,10 @@ class PlannerAgent:
             plan_dict = json.loads(json_str)
 
             # Replace {{INDEX_ID}} in tool_args
-            if plan_dict.get("tasks"):
-                for task in plan_dict["tasks"]:
-                    if task.get("tool_args") and "index_id" in task["tool_args"]:
-                        if task["tool_args"]["index_id"] == "{{INDEX_ID}}":
-                            task["tool_args"]["index_id"] = index_id
+            for task in plan_dict.get("tasks") or ():
+                tool_args = task.get("tool_args")
+                if tool_args and tool_args.get("index_id") == "{{INDEX_ID}}":
+                    tool_args["index_id"] = index_id
 
             # Create Plan object
             return Plan.model_validate(plan_dict)
@@ -2,6 +2,7 @@
 Responder Agent - Generates final responses
 """
 import logging
+import time
 from typing import Dict, Any, AsyncIterator, List
 from datetime import datetime
 from strands import Agent
@@ -76,11 +77,14 @@ class ResponderAgent:
             results_text = self._build_results_text(executed_tasks)
 
             # Build plan text
-            plan_text = f"Overview: {plan.overview}\n"
+            plan_lines = [f"Overview: {plan.overview}\n"]
             if plan.tasks:
-                plan_text += "Tasks:\n"
-                for i, task in enumerate(plan.tasks, 1):
-                    plan_text += f"{i}. {task.title}: {task.description}\n"
+                plan_lines.append("Tasks:\n")
+                plan_lines.extend(
+                    f"{i}. {task.title}: {task.description}\n"
+                    for i, task in enumerate(plan.tasks, 1)
+                )
+            plan_text = "".join(plan_lines)
 
             # Format instruction
             instruction = prompt_manager.format_instruction(
@@ -101,48 +105,48 @@ class ResponderAgent:
             yield {
                 "type": "response_start",
                 "message": "Generating comprehensive response...",
-                "timestamp": datetime.now().timestamp()
+                "timestamp": time.time()
             }
 
-            # Stream response tokens
-            full_response = ""
+            # Stream response tokens (joined once at the end)
+            response_parts = []
             async for event in self.agent.stream_async(instruction):
                 # Handle different event types
                 if "data" in event:
                     token = event["data"]
                     if token:
-                        full_response += token
+                        response_parts.append(token)
                         yield {
                             "type": "response_token",
                             "token": token,
-                            "timestamp": datetime.now().timestamp()
+                            "timestamp": time.time()
                         }
                 elif "content_delta" in event:
                     delta = event["content_delta"]
                     token = delta.get("text", "")
                     if token:
-                        full_response += token
+                        response_parts.append(token)
                         yield {
                             "type": "response_token",
                             "token": token,
-                            "timestamp": datetime.now().timestamp()
+                            "timestamp": time.time()
                         }
                 elif "contentBlockDelta" in event:
                     delta = event["contentBlockDelta"]
                     if "delta" in delta and "text" in delta["delta"]:
                         token = delta["delta"]["text"]
-                        full_response += token
+                        response_parts.append(token)
                         yield {
                             "type": "response_token",
                             "token": token,
-                            "timestamp": datetime.now().timestamp()
+                            "timestamp": time.time()
                         }
 
             # Yield response complete
             yield {
                 "type": "response_complete",
-                "response": full_response,
-                "timestamp": datetime.now().timestamp()
+                "response": "".join(response_parts),
+                "timestamp": time.time()
             }
 
         except Exception as e:
@@ -150,7 +154,7 @@ class ResponderAgent:
             yield {
                 "type": "response_error",
                 "error": str(e),
-                "timestamp": datetime.now().timestamp()
+                "timestamp": time.time()
             }
 
     def _build_results_text(self, executed_tasks: List[Dict[str, Any]]) -> str:
@@ -159,23 +163,21 @@ class ResponderAgent:
 
         for i, task_info in enumerate(executed_tasks, 1):
             task = task_info.get("task")
-            success = task_info.get("success", False)
 
-            if not success:
-                error = task_info.get("error", "Unknown error")
-                results_parts.append(f"Task {i} ({task.title}): Failed - {error}")
-                continue
-
-            # Get task result - handle both Task object and dict
-            result = ""
+            # Resolve title/result once - handle both Task object and dict
             if isinstance(task, dict):
                 # Task is a dict (from model_dump)
-                result = task.get("result", "")
-                task_title = task.get("title", f"Task {i}")
+                result = task.get("result") or ""
+                task_title = task.get("title") or f"Task {i}"
             else:
                 # Task is a Task object
-                result = task.result if hasattr(task, 'result') and task.result else ""
-                task_title = task.title if hasattr(task, 'title') else f"Task {i}"
+                result = getattr(task, "result", None) or ""
+                task_title = getattr(task, "title", None) or f"Task {i}"
+
+            if not task_info.get("success", False):
+                error = task_info.get("error") or result or "Unknown error"
+                results_parts.append(f"Task {i} ({task_title}): Failed - {error}")
+                continue
 
             if result:
                 results_parts.append(f"Task {i} ({task_title}):\n{result}")
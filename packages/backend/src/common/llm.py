@@ -15,6 +15,10 @@ from threading import Lock
 # logging configuration
 logger = logging.getLogger(__name__)
 
+# ANSI escape strings resolved once (plain str, no colorama attribute lookups per log)
+_CYAN = str(colorama.Fore.CYAN)
+_RESET = str(colorama.Style.RESET_ALL)
+
 # Load environment variables using path resolver
 try:
     from ..utils.path_resolver import path_resolver
@@ -77,7 +81,10 @@ def get_llm(
     profile_name = profile_name or os.environ.get("AWS_PROFILE")
     role_arn = os.environ.get("AWS_BEDROCK_ROLE_ARN", "")
 
-    logger.info(f"initialize Bedrock model: {colorama.Fore.CYAN}{model_id}{colorama.Style.RESET_ALL}, temperature={colorama.Fore.CYAN}{temp}{colorama.Style.RESET_ALL}, max_tokens={colorama.Fore.CYAN}{tokens}{colorama.Style.RESET_ALL}, region={colorama.Fore.CYAN}{region_name}{colorama.Style.RESET_ALL}")
+    logger.info(
+        "initialize Bedrock model: %s%s%s, temperature=%s%s%s, max_tokens=%s%s%s, region=%s%s%s",
+        _CYAN, model_id, _RESET, _CYAN, temp, _RESET, _CYAN, tokens, _RESET, _CYAN, region_name, _RESET
+    )
     
     if role_arn:
         # Assume role
@@ -5,10 +5,13 @@ Standardized response formatter for MCP server
 - LLM guide for Agent
 - Ensure consistent response structure
 """
+import logging
 import uuid
 from typing import Dict, Any, List, Optional, Union
 from urllib.parse import unquote
 
+logger = logging.getLogger(__name__)
+
 
 class ResponseFormatter:
     """Response formatter class"""
@@ -104,7 +107,7 @@ class ResponseFormatter:
             # Other tools can be added as needed
             
         except Exception as e:
-            print(f"Error occurred during references creation: {str(e)}")
+            logger.error("Error occurred during references creation: %s", e)
         
         return references
     
@@ -135,7 +138,7 @@ class ResponseFormatter:
             # If it's a document-wide analysis result with pages array
             elif 'pages' in data and isinstance(data['pages'], list):
                 pages = data['pages']
-                print(f"📄 Processing document analysis with {len(pages)} pages")
+                logger.debug("📄 Processing document analysis with %d pages", len(pages))
                 
                 # Create references from page data
                 for page_info in pages:
@@ -144,9 +147,9 @@ class ResponseFormatter:
                         image_ref = self._create_page_reference_from_page_data(page_info, session_id)
                         if image_ref:
                             references.append(image_ref)
-                            print(f"📄 Added image reference for page {image_ref.get('page_number', 'unknown')}")
+                            logger.debug("📄 Added image reference for page %s", image_ref.get('page_number', 'unknown'))
                         else:
-                            print(f"📄 Failed to create image reference for page {page_info.get('page_index', 'unknown')}")
+                            logger.debug("📄 Failed to create image reference for page %s", page_info.get('page_index', 'unknown'))
                 
                 # Add PDF reference using first page data
                 if pages and len(pages) > 0:
@@ -154,9 +157,9 @@ class ResponseFormatter:
                     pdf_ref = self._create_pdf_reference_from_page_data(first_page)
                     if pdf_ref:
                         references.append(pdf_ref)
-                        print(f"📄 Added PDF reference: {pdf_ref.get('file_name', 'unknown')}")
+                        logger.debug("📄 Added PDF reference: %s", pdf_ref.get('file_name', 'unknown'))
                 
-                print(f"📄 Total references created: {len(references)}")
+                logger.debug("📄 Total references created: %d", len(references))
             
             # If it's a document-wide analysis result with document object
             elif 'document' in data:
@@ -185,7 +188,7 @@ class ResponseFormatter:
                     references.append(page_ref)
                 
         except Exception as e:
-            print(f"Error occurred during document references creation: {str(e)}")
+            logger.error("Error occurred during document references creation: %s", e)
         
         return references
     
@@ -223,7 +226,7 @@ class ResponseFormatter:
                             self.session_cache[session_key].add(page_id)
                             
         except Exception as e:
-            print(f"Error occurred during search references creation: {str(e)}")
+            logger.error("Error occurred during search references creation: %s", e)
         
         return references
     
@@ -260,7 +263,7 @@ class ResponseFormatter:
                         references.append(pdf_ref)
                         
         except Exception as e:
-            print(f"Error occurred during document list references creation: {str(e)}")
+            logger.error("Error occurred during document list references creation: %s", e)
         
         return references
     
@@ -314,7 +317,7 @@ class ResponseFormatter:
             return reference
             
         except Exception as e:
-            print(f"Error occurred during image reference creation: {str(e)}")
+            logger.error("Error occurred during image reference creation: %s", e)
             return None
     
     def _create_search_image_reference(self, result: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -362,7 +365,7 @@ class ResponseFormatter:
             return reference
             
         except Exception as e:
-            print(f"Error occurred during search image reference creation: {str(e)}")
+            logger.error("Error occurred during search image reference creation: %s", e)
             return None
     
     def _create_page_reference_from_page_data(self, page_data: Dict[str, Any], 
@@ -422,7 +425,7 @@ class ResponseFormatter:
             return reference
             
         except Exception as e:
-            print(f"Error occurred during page reference creation: {str(e)}")
+            logger.error("Error occurred during page reference creation: %s", e)
             return None
 
     def _create_pdf_reference_from_page_data(self, page_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -456,7 +459,7 @@ class ResponseFormatter:
             }
             
         except Exception as e:
-            print(f"Error occurred during PDF reference creation: {str(e)}")
+            logger.error("Error occurred during PDF reference creation: %s", e)
             return None
 
     def _create_page_specific_reference(self, data: Dict[str, Any], 
@@ -509,7 +512,7 @@ class ResponseFormatter:
             return reference
             
         except Exception as e:
-            print(f"Error occurred during page-specific reference creation: {str(e)}")
+            logger.error("Error occurred during page-specific reference creation: %s", e)
             return None
 
     def _create_pdf_reference(self, document: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -540,7 +543,7 @@ class ResponseFormatter:
             }
             
         except Exception as e:
-            print(f"Error occurred during PDF reference creation: {str(e)}")
+            logger.error("Error occurred during PDF reference creation: %s", e)
             return None
     
     def _create_llm_guide(self, tool_name: str, api_response: Dict[str, Any]) -> Optional[str]:
@@ -588,7 +591,7 @@ class ResponseFormatter:
                 "The task has been completed. If you need additional information, please use another tool.")
             
         except Exception as e:
-            print(f"Error occurred during LLM guide creation: {str(e)}")
+            logger.error("Error occurred during LLM guide creation: %s", e)
             return "The tool execution has been completed."
 
 
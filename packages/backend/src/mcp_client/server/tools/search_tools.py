@@ -1,12 +1,15 @@
 """
 Search tools for MCP server - Refactored with API-First approach
 """
+import logging
 import requests
 import uuid
 from typing import Dict, Any
 from config import get_app_config
 from .response_formatter import format_api_response
 
+logger = logging.getLogger(__name__)
+
 # Get configuration
 conf = get_app_config()
 API_BASE_URL = conf['api_base_url']
@@ -82,9 +85,9 @@ async def hybrid_search(index_id: str, query: str, session_id: str = None):
     
     if not session_id:
         session_id = str(uuid.uuid4())
-        print(f"🆔 [search_tools] Auto-generated session_id: {session_id}")
+        logger.debug("🆔 [search_tools] Auto-generated session_id: %s", session_id)
     
-    print(f"� Performing hybrid search: query={query}, session_id={session_id}")
+    logger.debug("🔍 Performing hybrid search: query=%s, session_id=%s", query, session_id)
 
     # API call
     api_response = await hybrid_search_api(index_id, query, session_id)
@@ -0,0 +1,149 @@
+"""
+Tests for the search agent ExecutorAgent
+"""
+import asyncio
+
+from src.agent.search_agent.tools.base import BaseTool
+from src.agent.search_agent.workflow.executor import ExecutorAgent, MAX_CONCURRENT_TASKS
+from src.agent.search_agent.workflow.state import Plan, Task
+
+
+class FakeSearchTool(BaseTool):
+    """Tool stub that returns the current contents of a fake index"""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+        self.index_contents = "v1"
+
+    def get_name(self) -> str:
+        return "fake_search"
+
+    def get_description(self) -> str:
+        return "Fake search tool"
+
+    async def execute(self, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return {
+            "success": True,
+            "count": 1,
+            "results": [{"content": self.index_contents}],
+            "references": [],
+            "llm_text": self.index_contents,
+            "error": None
+        }
+
+
+def _make_plan(count: int) -> Plan:
+    return Plan(
+        requires_tool=True,
+        tasks=[
+            Task(title=f"Task {i}", tool_name="fake_search", tool_args={"query": "q"})
+            for i in range(count)
+        ]
+    )
+
+
+def _run(executor: ExecutorAgent, plan: Plan):
+    async def collect():
+        return [event async for event in executor.astream(plan)]
+    return asyncio.run(collect())
+
+
+def test_tool_cache_does_not_outlive_request():
+    tool = FakeSearchTool()
+    executor = ExecutorAgent(tools={"fake_search": tool})
+
+    first = _run(executor, _make_plan(1))
+    # Index contents change between requests (e.g. a document was re-indexed)
+    tool.index_contents = "v2"
+    second = _run(executor, _make_plan(1))
+
+    assert tool.calls == 2
+    first_complete = next(e for e in first if e["type"] == "task_complete")
+    second_complete = next(e for e in second if e["type"] == "task_complete")
+    assert first_complete["task"]["result"] == "v1"
+    assert second_complete["task"]["result"] == "v2"
+    assert second_complete["cache_hit"] is False
+
+
+def test_identical_calls_within_request_share_one_execution():
+    tool = FakeSearchTool()
+    executor = ExecutorAgent(tools={"fake_search": tool})
+    task_count = MAX_CONCURRENT_TASKS + 2
+
+    events = _run(executor, _make_plan(task_count))
+
+    # Concurrent duplicates join the in-flight call; queued ones reuse its result
+    completes = [e for e in events if e["type"] == "task_complete"]
+    assert tool.calls == 1
+    assert sum(e["cache_hit"] for e in completes) == task_count - 1
+    assert all(e["task"]["result"] == "v1" for e in completes)
+
+
+def test_no_cache_tools_run_every_call():
+    tool = FakeSearchTool()
+    tool.no_cache = True
+    executor = ExecutorAgent(tools={"fake_search": tool})
+
+    events = _run(executor, _make_plan(3))
+
+    completes = [e for e in events if e["type"] == "task_complete"]
+    assert tool.calls == 3
+    assert not any(e["cache_hit"] for e in completes)
+
+
+def test_tasks_start_only_when_a_slot_is_free():
+    tool = FakeSearchTool()
+    executor = ExecutorAgent(tools={"fake_search": tool})
+    task_count = MAX_CONCURRENT_TASKS + 2
+
+    events = _run(executor, _make_plan(task_count))
+    task_events = [e for e in events if e["type"] in ("task_start", "task_complete")]
+
+    # The first batch starts immediately; queued tasks start only after a task completes
+    assert [e["type"] for e in task_events[:MAX_CONCURRENT_TASKS + 1]] == (
+        ["task_start"] * MAX_CONCURRENT_TASKS + ["task_complete"]
+    )
+
+    running = set()
+    for event in task_events:
+        if event["type"] == "task_start":
+            assert event["task"]["status"] == "executing"
+            running.add(event["task_index"])
+            assert len(running) <= MAX_CONCURRENT_TASKS
+        else:
+            assert event["task_index"] in running
+            running.remove(event["task_index"])
+
+    assert not running
+    assert events[-1]["type"] == "execution_complete"
+    assert [t["task"]["title"] for t in events[-1]["executed_tasks"]] == [
+        f"Task {i}" for i in range(task_count)
+    ]
+
+
+def test_failure_before_task_start_still_finishes_the_stream(monkeypatch):
+    tool = FakeSearchTool()
+    executor = ExecutorAgent(tools={"fake_search": tool})
+    plan = _make_plan(2)
+    original_model_dump = Task.model_dump
+
+    def failing_model_dump(self, *args, **kwargs):
+        if self.title == "Task 0":
+            raise RuntimeError("dump failed")
+        return original_model_dump(self, *args, **kwargs)
+
+    monkeypatch.setattr(Task, "model_dump", failing_model_dump)
+
+    async def collect():
+        return [event async for event in executor.astream(plan)]
+    events = asyncio.run(asyncio.wait_for(collect(), timeout=5))
+
+    failed = [e for e in events if e["type"] == "task_failed"]
+    assert [e["task_index"] for e in failed] == [0]
+    assert failed[0]["task"]["title"] == "Task 0"
+    assert failed[0]["error"] == "dump failed"
+    assert events[-1]["type"] == "execution_complete"
+    assert events[-1]["successful_tasks"] == 1
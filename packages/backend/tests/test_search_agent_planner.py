@@ -0,0 +1,50 @@
+"""
+Tests for the search agent PlannerAgent
+"""
+import asyncio
+import json
+
+from src.agent.search_agent.workflow.planner import PlannerAgent
+
+
+class FakeStreamingAgent:
+    """Strands agent stub that streams a fixed plan"""
+
+    def __init__(self, plan):
+        self.plan = plan
+        self.calls = 0
+
+    async def stream_async(self, instruction):
+        self.calls += 1
+        text = json.dumps(self.plan)
+        for start in range(0, len(text), 8):
+            yield {"data": text[start:start + 8]}
+
+
+def _plan_events(planner: PlannerAgent, query: str):
+    async def collect():
+        return [event async for event in planner.astream(query=query, index_id="idx")]
+    return asyncio.run(collect())
+
+
+def test_identical_queries_are_planned_again():
+    planner = PlannerAgent(model_id="test-model")
+    planner.agent = FakeStreamingAgent({
+        "requires_tool": True,
+        "overview": "search",
+        "tasks": [{
+            "title": "Search",
+            "tool_name": "hybrid_search",
+            "tool_args": {"query": "q", "index_id": "{{INDEX_ID}}"}
+        }]
+    })
+
+    first = _plan_events(planner, "what is in the report?")
+    second = _plan_events(planner, "what is in the report?")
+
+    # Index contents may change between requests, so plans are never replayed
+    assert planner.agent.calls == 2
+    for events in (first, second):
+        plan = events[-1]
+        assert plan["type"] == "plan_complete"
+        assert plan["plan"]["tasks"][0]["tool_args"]["index_id"] == "idx"
@@ -3,6 +3,7 @@ Common utility functions for Lambda Layer.
 """
 
 import os
+import re
 import uuid
 import logging
 import json
@@ -36,12 +37,21 @@ def parse_s3_uri(s3_uri: str) -> Tuple[str, str]:
     return '', s3_uri
 
 
-def setup_logging(level: str = 'INFO') -> logging.Logger:
-    """Setup logging configuration."""
+_LOGGING_INITIALIZED = False
+
+
+def setup_logging(level: str = 'INFO', force: bool = False) -> logging.Logger:
+    """Setup logging configuration (only once per process unless force=True)."""
+    global _LOGGING_INITIALIZED
+    if _LOGGING_INITIALIZED and not force:
+        return logging.getLogger(__name__)
+
     logging.basicConfig(
         level=getattr(logging, level.upper()),
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        force=force
     )
+    _LOGGING_INITIALIZED = True
     return logging.getLogger(__name__)
 
 
@@ -70,7 +80,7 @@ def handle_lambda_error(error: Exception, context: Optional[Dict[str, Any]] = No
             'context': context
         })
     
-    logging.error(f"Lambda error: {str(error)}", exc_info=True)
+    logging.error("Lambda error: %s", error, exc_info=True)
     return error_response
 
 
@@ -143,22 +153,25 @@ def validate_uuid(uuid_string: str) -> bool:
         return False
 
 
+# Precompiled patterns for sanitize_filename
+_UNSAFE_NAME_CHARS_RE = re.compile(r'[^a-zA-Z0-9._-]')
+_UNSAFE_EXT_CHARS_RE = re.compile(r'[^a-zA-Z0-9.]')
+_REPEATED_UNDERSCORE_RE = re.compile(r'_{2,}')
+
+
 def sanitize_filename(filename: str) -> str:
     """Sanitize filename for BDA compatibility and safe storage."""
-    import re
-    import os
-    
     # Get file extension
     name, ext = os.path.splitext(filename)
     
     # Remove or replace unsafe characters for BDA compatibility
     # BDA requires strict S3 URI patterns, so we'll be very conservative
     # Allow only alphanumeric, dots, hyphens, and underscores
-    name = re.sub(r'[^a-zA-Z0-9._-]', '_', name)
-    ext = re.sub(r'[^a-zA-Z0-9.]', '', ext)  # Extensions should be clean
+    name = _UNSAFE_NAME_CHARS_RE.sub('_', name)
+    ext = _UNSAFE_EXT_CHARS_RE.sub('', ext)  # Extensions should be clean
     
     # Remove consecutive underscores
-    name = re.sub(r'_{2,}', '_', name)
+    name = _REPEATED_UNDERSCORE_RE.sub('_', name)
     
     # Remove leading/trailing underscores and dots
     name = name.strip('_.')
@@ -260,6 +273,9 @@ def retry_with_backoff(func, max_retries: int = 3, backoff_factor: float = 2.0,
     """Retry function with exponential backoff."""
     import time
     
+    # Backoff delays are fixed per decorated function, so compute them once
+    delays = tuple(backoff_factor ** attempt for attempt in range(max_retries))
+    
     def wrapper(*args, **kwargs):
         for attempt in range(max_retries):
             try:
@@ -268,7 +284,7 @@ def retry_with_backoff(func, max_retries: int = 3, backoff_factor: float = 2.0,
                 if attempt == max_retries - 1:
                     raise
                 
-                wait_time = backoff_factor ** attempt
+                wait_time = delays[attempt]
                 logging.warning(f"Attempt {attempt + 1} failed: {str(e)}. Retrying in {wait_time} seconds...")
                 time.sleep(wait_time)
     
@@ -63,6 +63,58 @@ from services.document_services import (
 # Removed: from services.activity_service import record_document_activity, ActivityType
 # Now using common ActivityRecorder
 
+# Supported upload extensions - expanded to support more media types
+SUPPORTED_EXTENSIONS = (
+    # Documents
+    '.pdf', '.dwg', '.dxf', '.txt', '.doc', '.docx', '.rtf', '.odt',
+    # Images  
+    '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.tif', '.webp',
+    # Videos
+    '.mp4', '.avi', '.mov', '.wmv', '.flv', '.mkv', '.webm', '.3gp',
+    # Audio
+    '.mp3', '.wav', '.flac', '.m4a', '.aac', '.ogg', '.wma', '.aiff'
+)
+
+# Extension -> MIME type map used when file_type is not provided
+FILE_TYPE_MAP = {
+    # Documents
+    'pdf': 'application/pdf',
+    'dwg': 'application/dwg', 
+    'dxf': 'application/dxf',
+    'txt': 'text/plain',
+    'doc': 'application/msword',
+    'docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    'rtf': 'application/rtf',
+    'odt': 'application/vnd.oasis.opendocument.text',
+    # Images
+    'jpg': 'image/jpeg',
+    'jpeg': 'image/jpeg',
+    'png': 'image/png',
+    'gif': 'image/gif',
+    'bmp': 'image/bmp',
+    'tiff': 'image/tiff',
+    'tif': 'image/tiff',
+    'webp': 'image/webp',
+    # Videos
+    'mp4': 'video/mp4',
+    'avi': 'video/x-msvideo',
+    'mov': 'video/quicktime',
+    'wmv': 'video/x-ms-wmv',
+    'flv': 'video/x-flv',
+    'mkv': 'video/x-matroska',
+    'webm': 'video/webm',
+    '3gp': 'video/3gpp',
+    # Audio
+    'mp3': 'audio/mpeg',
+    'wav': 'audio/wav',
+    'flac': 'audio/flac',
+    'm4a': 'audio/mp4',
+    'aac': 'audio/aac',
+    'ogg': 'audio/ogg',
+    'wma': 'audio/x-ms-wma',
+    'aiff': 'audio/aiff'
+}
+
 # Lambda Layer 서비스 초기화
 db_service = DynamoDBService()
 s3_service = S3Service()
@@ -118,62 +170,15 @@ def handle_upload_document(event: Dict[str, Any]) -> Dict[str, Any]:
                 f"File size is too large ({file_size_mb}MB). You can upload up to 500MB."
             )
         
-        # File extension validation - expanded to support more media types
-        supported_extensions = [
-            # Documents
-            '.pdf', '.dwg', '.dxf', '.txt', '.doc', '.docx', '.rtf', '.odt',
-            # Images  
-            '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.tif', '.webp',
-            # Videos
-            '.mp4', '.avi', '.mov', '.wmv', '.flv', '.mkv', '.webm', '.3gp',
-            # Audio
-            '.mp3', '.wav', '.flac', '.m4a', '.aac', '.ogg', '.wma', '.aiff'
-        ]
-        if not validate_file_extension(file_name, supported_extensions):
+        # File extension validation
+        if not validate_file_extension(file_name, SUPPORTED_EXTENSIONS):
             return create_validation_error_response("Unsupported file type")
         
         # Auto-detect file type
         if not file_type:
-            file_extension = file_name.lower().split('.')[-1] if '.' in file_name else ''
-            file_type_map = {
-                # Documents
-                'pdf': 'application/pdf',
-                'dwg': 'application/dwg', 
-                'dxf': 'application/dxf',
-                'txt': 'text/plain',
-                'doc': 'application/msword',
-                'docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
-                'rtf': 'application/rtf',
-                'odt': 'application/vnd.oasis.opendocument.text',
-                # Images
-                'jpg': 'image/jpeg',
-                'jpeg': 'image/jpeg',
-                'png': 'image/png',
-                'gif': 'image/gif',
-                'bmp': 'image/bmp',
-                'tiff': 'image/tiff',
-                'tif': 'image/tiff',
-                'webp': 'image/webp',
-                # Videos
-                'mp4': 'video/mp4',
-                'avi': 'video/x-msvideo',
-                'mov': 'video/quicktime',
-                'wmv': 'video/x-ms-wmv',
-                'flv': 'video/x-flv',
-                'mkv': 'video/x-matroska',
-                'webm': 'video/webm',
-                '3gp': 'video/3gpp',
-                # Audio
-                'mp3': 'audio/mpeg',
-                'wav': 'audio/wav',
-                'flac': 'audio/flac',
-                'm4a': 'audio/mp4',
-                'aac': 'audio/aac',
-                'ogg': 'audio/ogg',
-                'wma': 'audio/x-ms-wma',
-                'aiff': 'audio/aiff'
-            }
-            file_type = file_type_map.get(file_extension, 'application/octet-stream')
+            _, dot, extension = file_name.rpartition('.')
+            file_extension = extension.lower() if dot else ''
+            file_type = FILE_TYPE_MAP.get(file_extension, 'application/octet-stream')
         
         # Note: BDA primarily supports documents and some images, but we allow all media types
         # Video/Audio files will be processed for basic metadata only via the workflow pipeline
@@ -843,62 +848,15 @@ def handle_generate_upload_presigned_url(event: Dict[str, Any]) -> Dict[str, Any
                 f"File size is too large ({file_size_mb}MB). You can upload up to 500MB."
             )
         
-        # File extension validation - expanded to support more media types
-        supported_extensions = [
-            # Documents
-            '.pdf', '.dwg', '.dxf', '.txt', '.doc', '.docx', '.rtf', '.odt',
-            # Images  
-            '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.tif', '.webp',
-            # Videos
-            '.mp4', '.avi', '.mov', '.wmv', '.flv', '.mkv', '.webm', '.3gp',
-            # Audio
-            '.mp3', '.wav', '.flac', '.m4a', '.aac', '.ogg', '.wma', '.aiff'
-        ]
-        if not validate_file_extension(file_name, supported_extensions):
+        # File extension validation
+        if not validate_file_extension(file_name, SUPPORTED_EXTENSIONS):
             return create_validation_error_response("Unsupported file type")
         
         # Auto-detect file type
         if not file_type:
-            file_extension = file_name.lower().split('.')[-1] if '.' in file_name else ''
-            file_type_map = {
-                # Documents
-                'pdf': 'application/pdf',
-                'dwg': 'application/dwg', 
-                'dxf': 'application/dxf',
-                'txt': 'text/plain',
-                'doc': 'application/msword',
-                'docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
-                'rtf': 'application/rtf',
-                'odt': 'application/vnd.oasis.opendocument.text',
-                # Images
-                'jpg': 'image/jpeg',
-                'jpeg': 'image/jpeg',
-                'png': 'image/png',
-                'gif': 'image/gif',
-                'bmp': 'image/bmp',
-                'tiff': 'image/tiff',
-                'tif': 'image/tiff',
-                'webp': 'image/webp',
-                # Videos
-                'mp4': 'video/mp4',
-                'avi': 'video/x-msvideo',
-                'mov': 'video/quicktime',
-                'wmv': 'video/x-ms-wmv',
-                'flv': 'video/x-flv',
-                'mkv': 'video/x-matroska',
-                'webm': 'video/webm',
-                '3gp': 'video/3gpp',
-                # Audio
-                'mp3': 'audio/mpeg',
-                'wav': 'audio/wav',
-                'flac': 'audio/flac',
-                'm4a': 'audio/mp4',
-                'aac': 'audio/aac',
-                'ogg': 'audio/ogg',
-                'wma': 'audio/x-ms-wma',
-                'aiff': 'audio/aiff'
-            }
-            file_type = file_type_map.get(file_extension, 'application/octet-stream')
+            _, dot, extension = file_name.rpartition('.')
+            file_extension = extension.lower() if dot else ''
+            file_type = FILE_TYPE_MAP.get(file_extension, 'application/octet-stream')
         
         # Note: BDA primarily supports documents and some images, but we allow all media types
         # Video/Audio files will be processed for basic metadata only via the workflow pipeline
@@ -181,7 +181,8 @@ def prepare_step_function_input(document_data: Dict[str, Any]) -> Dict[str, Any]
     try:
         # Extract file extension and determine processing type
         file_name = document_data.get('file_name', '')
-        file_extension = file_name.lower().split('.')[-1] if '.' in file_name else ''
+        _, dot, extension = file_name.rpartition('.')
+        file_extension = extension.lower() if dot else ''
         
         # Define MIME type and processing type mapping
         type_map = {
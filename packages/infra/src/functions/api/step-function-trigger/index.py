@@ -148,7 +148,8 @@ def prepare_step_function_input(sqs_message: Dict[str, Any]) -> Dict[str, Any]:
         
         # Extract file extension and determine processing type
         file_name = sqs_message['file_name']
-        file_extension = file_name.lower().split('.')[-1] if '.' in file_name else ''
+        _, dot, extension = file_name.rpartition('.')
+        file_extension = extension.lower() if dot else ''
         
         # Define MIME type and processing type mapping
         type_map = {
@@ -2,11 +2,12 @@
 Refactored AnalysisAgent - Optimized for LangGraph structure
 """
 
+import json
 import logging
 import time
 from datetime import datetime, timezone
 from typing import Dict, Any
-from langchain_core.messages import HumanMessage
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 from langchain_core.runnables import RunnableConfig
 
 # Common module imports
@@ -23,6 +24,23 @@ from agent.graph.builder import create_analysis_graph
 logger = logging.getLogger(__name__)
 
 
+def _bounded_json_dumps(obj: Any, max_chars: int) -> str:
+    """
+    객체를 JSON으로 직렬화하되 max_chars까지만 생성
+    
+    전체를 직렬화한 뒤 자르지 않고, iterencode 청크가 한도에 도달하면 중단
+    """
+    encoder = json.JSONEncoder(indent=2, default=str, ensure_ascii=False)
+    parts = []
+    size = 0
+    for chunk in encoder.iterencode(obj):
+        parts.append(chunk)
+        size += len(chunk)
+        if size >= max_chars:
+            break
+    return "".join(parts)[:max_chars]
+
+
 class AnalysisAgent:
     """
     LangGraph-based analysis agent
@@ -462,8 +480,6 @@ class AnalysisAgent:
         
         logger.info(f"   - 메시지 타입별 통계: {message_types}")
         
-        from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
-        
         # AI 메시지 추출 (개선된 방법들)
         ai_messages = []
         
@@ -534,9 +550,8 @@ class AnalysisAgent:
         else:
             logger.error("❌ 최종 콘텐츠 추출 실패 - 모든 방법 실패")
             logger.error("❌ final_state 전체 덤프:")
-            import json
             try:
-                state_dump = json.dumps(final_state, indent=2, default=str, ensure_ascii=False)[:2000]
+                state_dump = _bounded_json_dumps(final_state, 2000)
                 logger.error(f"   State dump (처음 2000자): {state_dump}")
             except Exception as dump_error:
                 logger.error(f"   State dump 실패: {dump_error}")
@@ -79,7 +79,6 @@ class ModelNode:
             final_response = self._generate_comprehensive_final_analysis(state, current_step, max_iterations)
             
             # 강제 종료를 위한 AIMessage 생성 (tool_calls 없음)
-            from langchain_core.messages import AIMessage
             final_message = AIMessage(content=final_response)
             
             updated_state = {
@@ -167,17 +166,18 @@ class ModelNode:
         tool_references = state.get('tool_references', [])
         tool_content = state.get('tool_content', '')
         
-        # 디버깅 로그
-        logger.info(f"🔍 _create_prompt 디버깅:")
-        logger.info(f"  - current_step: {current_step}")
-        logger.info(f"  - combined_context 길이: {len(combined_context)}")
-        logger.info(f"  - previous_context 길이: {len(previous_context)}")
-        logger.info(f"  - analysis_history 개수: {len(analysis_history)}")
-        logger.info(f"  - tool_references 개수: {len(tool_references)}")
-        logger.info(f"  - tool_content 길이: {len(tool_content)}")
+        # 디버깅 로그 (DEBUG 레벨에서만 포맷팅)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🔍 _create_prompt 디버깅:")
+            logger.debug("  - current_step: %s", current_step)
+            logger.debug("  - combined_context 길이: %d", len(combined_context))
+            logger.debug("  - previous_context 길이: %d", len(previous_context))
+            logger.debug("  - analysis_history 개수: %d", len(analysis_history))
+            logger.debug("  - tool_references 개수: %d", len(tool_references))
+            logger.debug("  - tool_content 길이: %d", len(tool_content))
         
         # combined_context 설정 (ToolNode에서 업데이트된 결과 사용)
-        if not combined_context or combined_context.strip() == "":
+        if not combined_context or combined_context.isspace():
             combined_context = "이전 분석 결과 없음"
         
         # 참조 정보를 문자열로 변환
@@ -192,7 +192,7 @@ class ModelNode:
             logger.info(f"📋 참조 정보 생성: {len(references_text)}자, {len(tool_references)}개 항목")
         
         # 도구 컨텐츠가 있으면 combined_context에 추가
-        if tool_content and tool_content.strip():
+        if tool_content and not tool_content.isspace():
             if combined_context and combined_context != "이전 분석 결과 없음":
                 combined_context = f"{combined_context}\n\n=== 최근 도구 실행 결과 ===\n{tool_content}"
             else:
@@ -219,8 +219,8 @@ class ModelNode:
         logger.info(f">>>>>>>>> PROMPT 생성 (단계 {current_step}) >>>>>>>>>")
         logger.info(f"System Prompt 길이: {len(prompt_data.get('system_prompt', ''))}")
         logger.info(f"Instruction 길이: {len(prompt_data.get('instruction', ''))}")
-        logger.info(f"전체 프롬프트 내용:")
-        logger.info(prompt_data)
+        # 전체 프롬프트 덤프는 DEBUG 레벨에서만 (분석 컨텍스트 포함으로 매우 큼)
+        logger.debug("전체 프롬프트 내용: %s", prompt_data)
         logger.info(f"<<<<<<<<< PROMPT 완료 (단계 {current_step}) <<<<<<<<<<<")
 
         logger.info(f"📝 프롬프트 생성 완료")
@@ -238,7 +238,6 @@ class ModelNode:
     def _prepare_messages(self, state: AgentState, prompt_data: Dict[str, str]) -> list:
         """메시지 준비"""
         messages = state.get('messages', [])
-        non_system_messages = [msg for msg in messages if not isinstance(msg, SystemMessage)]
         
         prompt_messages = [
             SystemMessage(content=prompt_data["system_prompt"])
@@ -247,7 +246,8 @@ class ModelNode:
         if "instruction" in prompt_data:
             prompt_messages.append(HumanMessage(content=prompt_data["instruction"]))
         
-        prompt_messages.extend(non_system_messages)
+        # 기존 SystemMessage는 새 시스템 프롬프트로 대체 (중간 리스트 없이 한 번에 추가)
+        prompt_messages.extend(msg for msg in messages if not isinstance(msg, SystemMessage))
         
         logger.info(f"📨 메시지 준비 완료: {len(prompt_messages)}개")
         return prompt_messages
@@ -287,10 +287,9 @@ class ModelNode:
         messages = response.get("messages", [])
         logger.info(f"📤 모델 응답 완료: {len(messages)}개 메시지")
         
-        # 마지막 AI 메시지 내용 로깅
-        ai_messages = [msg for msg in messages if isinstance(msg, AIMessage)]
-        if ai_messages:
-            last_ai_msg = ai_messages[-1]
+        # 마지막 AI 메시지 내용 로깅 (뒤에서부터 첫 AIMessage만 탐색)
+        last_ai_msg = next((msg for msg in reversed(messages) if isinstance(msg, AIMessage)), None)
+        if last_ai_msg is not None:
             content_preview = str(last_ai_msg.content)[:200] + "..." if len(str(last_ai_msg.content)) > 200 else str(last_ai_msg.content)
             logger.info(f"🤖 AI 응답: {content_preview}")
             
@@ -301,10 +300,17 @@ class ModelNode:
     
     def _normalize_content(self, content: Any) -> str:
         """메시지 내용 정규화"""
+        # 가장 흔한 경우(문자열)는 변환 없이 그대로 반환
+        if isinstance(content, str):
+            return content
+        
         if content is None:
             return ""
         
         if isinstance(content, list):
+            # 모든 항목이 문자열이면 str() 변환 없이 바로 결합
+            if all(isinstance(item, str) for item in content):
+                return "".join(content)
             return "".join(str(item) for item in content)
         
         return str(content)
@@ -322,26 +328,20 @@ class ModelNode:
         analysis_history = state.get('analysis_history', [])
         combined_context = state.get('combined_analysis_context', '')
         
-        # 사용된 도구들 요약
-        tools_used = []
+        # 사용된 도구들 요약 (순서 유지 중복 제거)
+        tools_used = list(dict.fromkeys(entry.get('tool_name', 'Unknown') for entry in analysis_history))
         successful_analyses = []
         
         for entry in analysis_history:
-            tool_name = entry.get('tool_name', 'Unknown')
-            success = entry.get('success', False)
             result = entry.get('result', '')
-            
-            if tool_name not in tools_used:
-                tools_used.append(tool_name)
-            
-            if success and result:
+            if entry.get('success', False) and result:
                 successful_analyses.append({
-                    'tool': tool_name,
+                    'tool': entry.get('tool_name', 'Unknown'),
                     'result': result[:500] + "..." if len(result) > 500 else result
                 })
         
-        # 최종 분석 결과 구성
-        final_analysis = f"""# 문서 분석 완료 보고서
+        # 최종 분석 결과 구성 (각 섹션을 모은 뒤 한 번에 결합)
+        parts = [f"""# 문서 분석 완료 보고서
 
 ## 🔍 분석 개요
 - **프로젝트 ID**: {index_id}
@@ -351,44 +351,44 @@ class ModelNode:
 - **상태**: 최대 반복 횟수 도달로 인한 분석 완료
 
 ## 🛠️ 사용된 분석 도구
-"""
+"""]
         
         if tools_used:
-            for tool in tools_used:
-                final_analysis += f"- {tool}\n"
+            parts.extend(f"- {tool}\n" for tool in tools_used)
         else:
-            final_analysis += "- 사용된 도구 없음\n"
+            parts.append("- 사용된 도구 없음\n")
         
-        final_analysis += f"""
+        parts.append(f"""
 ## 📊 분석 결과 요약
 
 ### 성공적으로 완료된 분석 ({len(successful_analyses)}건)
-"""
+""")
         
         if successful_analyses:
-            for i, analysis in enumerate(successful_analyses, 1):
-                final_analysis += f"""
+            parts.extend(f"""
 #### {i}. {analysis['tool']} 분석 결과
 {analysis['result']}
-"""
+""" for i, analysis in enumerate(successful_analyses, 1))
         else:
-            final_analysis += "- 완료된 분석 결과 없음\n"
+            parts.append("- 완료된 분석 결과 없음\n")
         
         # 종합 분석 컨텍스트가 있는 경우 포함
-        if combined_context and combined_context.strip():
-            final_analysis += f"""
+        if combined_context and not combined_context.isspace():
+            parts.append(f"""
 ## 🔗 종합 분석 내용
 {combined_context[:1000]}{"..." if len(combined_context) > 1000 else ""}
-"""
+""")
         
-        final_analysis += f"""
+        parts.append(f"""
 ## ⚠️ 분석 완료 사유
 최대 반복 횟수({max_iterations})에 도달하여 분석을 완료했습니다. 
 위의 결과는 {current_step}단계에 걸쳐 수집된 모든 분석 정보를 종합한 것입니다.
 
 ---
 *분석 완료 시간: {datetime.now(tz=timezone.utc).isoformat()}*
-"""
+""")
+        
+        final_analysis = "".join(parts)
         
         logger.info(f"📝 종합 분석 결과 생성 완료 - 길이: {len(final_analysis)} 문자")
         logger.info(f"📝 포함된 분석 결과: {len(successful_analyses)}건")
@@ -2,11 +2,12 @@
 LangGraph Tool Node - 도구 실행 담당
 """
 
+import json
 import logging
 import time
 import os
 import sys
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from langchain_core.tools import BaseTool
 from langchain_core.messages import ToolMessage, AIMessage
 from langgraph.prebuilt import ToolNode as BaseToolNode
@@ -22,6 +23,9 @@ logger = logging.getLogger(__name__)
 
 BEDROCK_AGENT_MODEL_ID = os.environ.get('BEDROCK_AGENT_MODEL_ID')
 
+# 도구 결과 data에서 추출 대상이 되는 키
+_EXTRACTABLE_KEYS = frozenset(("references", "content"))
+
 def _update_combined_analysis_context(state: AgentState, analysis_history: List[Dict[str, Any]]) -> str:
     """
     이전 분석 내용과 현재 세션 분석 이력을 결합해서 combined_analysis_context 생성
@@ -103,7 +107,7 @@ class ToolNode:
         if state_aware_tools:
             logger.info(f"📊 StateAware 도구: {state_aware_tools}")
     
-    def __call__(self, state: AgentState) -> AgentState:
+    def __call__(self, state: AgentState) -> Dict[str, Any]:
         """
         도구 노드 실행
         
@@ -111,7 +115,7 @@ class ToolNode:
             state: LangGraph AgentState
             
         Returns:
-            업데이트된 AgentState
+            변경된 State 필드 (LangGraph가 기존 State에 병합)
         """
         logger.info("=== 🔧 TOOL NODE 실행 ===")
         
@@ -142,9 +146,9 @@ class ToolNode:
         self._log_execution_results(tool_messages, tools_used, analysis_history)
         
         # 상태 업데이트 (ToolNode는 tool_results, tools_used, analysis_history, combined_analysis_context 담당)
+        # 변경된 필드만 반환 - 전체 State 복사 없이 LangGraph가 병합
         messages = state.get("messages", [])
         updated_state = {
-            **state,
             "messages": messages + tool_messages,
             "tools_used": tools_used,
             "tool_results": tool_results,
@@ -177,7 +181,7 @@ class ToolNode:
         logger.info(f"🛠️ 실행할 도구: {[tc['name'] for tc in tool_calls]}")
         return tool_calls
     
-    def _execute_tools(self, state: AgentState, tool_calls: List[Dict[str, Any]]) -> tuple:
+    def _execute_tools(self, state: AgentState, tool_calls: List[Dict[str, Any]]) -> Tuple[List[ToolMessage], List[str], List[Dict[str, Any]], List[Dict[str, Any]]]:
         """도구들을 실행하고 결과 반환"""
         tool_messages = []
         tools_used = state.get("tools_used", []).copy()
@@ -248,7 +252,7 @@ class ToolNode:
         
         return tool_messages, tools_used, tool_results, analysis_history
     
-    def _execute_single_tool(self, state: AgentState, tool_name: str, tool_args: Dict[str, Any], tool_call_id: str) -> tuple:
+    def _execute_single_tool(self, state: AgentState, tool_name: str, tool_args: Dict[str, Any], tool_call_id: str) -> Tuple[ToolMessage, bool, Optional[Dict[str, Any]]]:
         """단일 도구 실행"""
         tool = self.tools.get(tool_name)
         if not tool:
@@ -414,12 +418,15 @@ class ToolNode:
             # OpenSearch 저장 실패는 전체 프로세스를 중단하지 않음
             pass
     
-    def _extract_references_and_content(self, tool_results: List[Dict[str, Any]]) -> tuple:
+    def _extract_references_and_content(self, tool_results: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], str]:
         """도구 실행 결과에서 references와 content 추출"""
+        if not tool_results:
+            return [], ""
+        
         extracted_references = []
         extracted_content_parts = []
         
-        logger.info(f"🔍 참조 및 컨텐츠 추출 시작 - {len(tool_results)}개 결과")
+        logger.info("🔍 참조 및 컨텐츠 추출 시작 - %d개 결과", len(tool_results))
         
         for tool_result in tool_results:
             try:
@@ -429,50 +436,90 @@ class ToolNode:
                 # data가 딕셔너리이고 success가 True인 경우에만 처리
                 if isinstance(data, dict) and data.get("success"):
                     result_data = data.get("data", {})
+                    # 추출 대상 키가 하나도 없으면 건너뜀
+                    if not isinstance(result_data, dict) or _EXTRACTABLE_KEYS.isdisjoint(result_data):
+                        continue
                     
                     # 1. references 추출
-                    if "references" in result_data:
-                        references = result_data["references"]
-                        if isinstance(references, list):
-                            for ref in references:
-                                if isinstance(ref, str):
-                                    # 문자열 형태의 reference를 구조화된 형태로 변환
-                                    ref_dict = {
-                                        "type": "document",
-                                        "title": ref,
-                                        "value": ref,
-                                        "metadata": {"tool": tool_name, "source": "tool_execution"}
-                                    }
-                                    extracted_references.append(ref_dict)
-                                elif isinstance(ref, dict):
-                                    # 이미 구조화된 reference
-                                    ref["metadata"] = ref.get("metadata", {})
-                                    ref["metadata"]["tool"] = tool_name
-                                    ref["metadata"]["source"] = "tool_execution"
-                                    extracted_references.append(ref)
-                            
-                            logger.info(f"📋 {tool_name}에서 {len(references)}개 참조 추출")
+                    references = result_data.get("references")
+                    if references is not None:
+                        self._process_refs(references, tool_name, extracted_references)
                     
                     # 2. content 추출
-                    if "content" in result_data:
-                        content = result_data["content"]
-                        if isinstance(content, list):
-                            # content가 리스트인 경우 각 항목을 문자열로 변환하여 추가
-                            for item in content:
-                                if item:  # 빈 값이 아닌 경우에만
-                                    extracted_content_parts.append(str(item))
-                        elif isinstance(content, str) and content.strip():
-                            # content가 문자열이고 빈 값이 아닌 경우
-                            extracted_content_parts.append(content)
-                        
-                        logger.info(f"📝 {tool_name}에서 컨텐츠 추출: {len(str(content))}자")
+                    content = result_data.get("content")
+                    if content is not None:
+                        self._process_content(content, tool_name, extracted_content_parts)
                 
             except Exception as e:
-                logger.error(f"❌ {tool_result.get('tool_name', 'unknown')} 결과 처리 실패: {str(e)}")
+                logger.error("❌ %s 결과 처리 실패: %s", tool_result.get('tool_name', 'unknown'), e)
         
         # 결합된 컨텐츠 생성
         combined_content = "\n\n".join(extracted_content_parts) if extracted_content_parts else ""
         
-        logger.info(f"✅ 추출 완료 - 참조: {len(extracted_references)}개, 컨텐츠: {len(combined_content)}자")
+        logger.info("✅ 추출 완료 - 참조: %d개, 컨텐츠: %d자", len(extracted_references), len(combined_content))
+        
+        return extracted_references, combined_content
+    
+    def _process_refs(self, references: Any, tool_name: str, out_list: List[Dict[str, Any]]) -> None:
+        """references 항목을 구조화된 형태로 변환하여 out_list에 추가"""
+        if not isinstance(references, list):
+            return
+        
+        # 참조마다 동일한 메타데이터는 한 번만 생성하고 복사해서 사용
+        meta_template = {"tool": tool_name, "source": "tool_execution"}
+        
+        out_list.extend(
+            self._make_reference(ref, meta_template)
+            for ref in references
+            if isinstance(ref, (str, dict))
+        )
+        
+        logger.info("📋 %s에서 %d개 참조 추출", tool_name, len(references))
+    
+    def _make_reference(self, ref: Any, meta_template: Dict[str, str]) -> Dict[str, Any]:
+        """문자열 또는 딕셔너리 reference를 구조화된 형태로 변환"""
+        if isinstance(ref, str):
+            # 문자열 형태의 reference를 구조화된 형태로 변환
+            return {
+                "type": "document",
+                "title": ref,
+                "value": ref,
+                "metadata": meta_template.copy()
+            }
+        
+        # 이미 구조화된 reference
+        metadata = ref.get("metadata")
+        if metadata is None:
+            ref["metadata"] = meta_template.copy()
+        else:
+            metadata.update(meta_template)
+        return ref
+    
+    def _process_content(self, content: Any, tool_name: str, out_list: List[str]) -> None:
+        """content 항목을 문자열로 변환하여 out_list에 추가"""
+        if isinstance(content, list):
+            # content가 리스트인 경우 각 항목을 문자열로 변환하여 추가
+            items = content
+        elif isinstance(content, str) and content and not content.isspace():
+            # content가 문자열이고 빈 값이 아닌 경우
+            items = (content,)
+        else:
+            items = ()
+        
+        added_length = 0
+        for item in items:
+            if isinstance(item, str):
+                # 이미 문자열이면 그대로 사용 (공백만 있는 항목은 제외)
+                if not item or item.isspace():
+                    continue
+                text = item
+            elif item:
+                # dict/list 등은 repr 대신 JSON으로 직렬화
+                text = json.dumps(item, ensure_ascii=False, default=str)
+            else:
+                continue
+            out_list.append(text)
+            added_length += len(text)
         
-        return extracted_references, combined_content
\ No newline at end of file
+        # 추가된 길이를 누적해서 기록 (content 전체를 다시 문자열화하지 않음)
+        logger.info("📝 %s에서 컨텐츠 추출: %d자", tool_name, added_length)
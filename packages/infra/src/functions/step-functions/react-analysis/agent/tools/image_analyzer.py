@@ -449,7 +449,7 @@ class ImageAnalyzerTool(StateAwareBaseTool):
             # Construct image content
             content_blocks = []
 
-            print(f"previous_analysis_context: {previous_analysis_context[:1000]}")
+            logger.debug("previous_analysis_context: %s", previous_analysis_context[:1000])
             
             # Analysis-focused prompt
             system_instruction = """You are a Technical Document Analysis Expert with deep expertise in interpreting complex technical documents, drawings, specifications, and engineering materials. Your role is to provide professional-level insights that go beyond surface-level observations to deliver meaningful technical and business value.
@@ -36,11 +36,14 @@ class StateAwareBaseTool(LangChainBaseTool, ABC):
         logger.info(f"🔍 도구 '{self.name}' 실행 완료 - hasattr(_execution_results): {hasattr(self, '_execution_results')}")
         logger.info(f"🔍 도구 '{self.name}' - result.data 존재: {result.data is not None}")
         if result.data:
-            logger.info(f"🔍 도구 '{self.name}' - result.data 내용: {result.data}")
+            # 전체 결과 덤프는 DEBUG 레벨에서만 (lazy 포맷팅)
+            logger.debug("🔍 도구 '%s' - result.data 내용: %s", self.name, result.data)
         
         if hasattr(self, '_execution_results') and result.data:
             self._execution_results[self.name] = result.data
-            logger.info(f"📦 도구 '{self.name}' 실행 결과 저장됨: {len(str(result.data))} 문자")
+            # 결과 크기 계산(전체 문자열화)은 INFO 로그가 켜져 있을 때만 수행
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("📦 도구 '%s' 실행 결과 저장됨: %d 문자", self.name, len(str(result.data)))
         elif hasattr(self, '_execution_results'):
             logger.warning(f"⚠️ 도구 '{self.name}' - _execution_results 있지만 result.data가 없음")
         else:
@@ -65,6 +68,8 @@ class StateAwareBaseTool(LangChainBaseTool, ABC):
         
         super().__init__(name=tool_name, description=tool_description)
         object.__setattr__(self, '_state', state or {})
+        # 같은 State 객체에 대한 컨텍스트 캐시 (set_state로 다른 State가 들어오면 무효화)
+        object.__setattr__(self, '_context_cache', None)
             
         # Set args_schema for LangChain compatibility if get_schema exists
         if hasattr(self, 'get_schema'):
@@ -80,6 +85,8 @@ class StateAwareBaseTool(LangChainBaseTool, ABC):
         Args:
             state: LangGraph State dictionary
         """
+        if state is not self._state:
+            object.__setattr__(self, '_context_cache', None)
         self._state = state
         
     def get_agent_context(self) -> Dict[str, Any]:
@@ -92,6 +99,10 @@ class StateAwareBaseTool(LangChainBaseTool, ABC):
         if not self._state:
             logger.warning("No LangGraph State available, returning empty context")
             return {}
+        
+        # 동일한 State에 대해서는 한 번 만든 컨텍스트를 복사해서 재사용
+        if self._context_cache is not None:
+            return dict(self._context_cache)
             
         context = {
             "index_id": self._state.get("index_id"),
@@ -117,7 +128,8 @@ class StateAwareBaseTool(LangChainBaseTool, ABC):
         logger.info(f"🔍 StateAware tool context: "
                    f"document_id={context.get('document_id')}, segment_id={context.get('segment_id')}")
         
-        return context
+        object.__setattr__(self, '_context_cache', context)
+        return dict(context)
         
     def execute_with_state(self, state: Dict[str, Any], **kwargs) -> ToolResult:
         """
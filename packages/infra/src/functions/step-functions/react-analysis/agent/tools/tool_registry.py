@@ -122,8 +122,7 @@ class ToolRegistry:
         """도구 결과 캐시 초기화"""
         cache_count = len(self._tool_results_cache)
         self._tool_results_cache.clear()
-        logger.info(f"도구 결과 캐시 초기화: {cache_count}개 항목 삭제")
-        print(f"🗑️ 도구 결과 캐시 초기화됨 (이전 {cache_count}개 항목 삭제)")
+        logger.info(f"🗑️ 도구 결과 캐시 초기화: {cache_count}개 항목 삭제")
     
     def get_cached_tool_results(self, limit: int = None, tool_name: str = None) -> List[Dict[str, Any]]:
         """캐시된 도구 결과 조회"""
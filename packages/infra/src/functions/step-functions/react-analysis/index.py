@@ -145,7 +145,7 @@ class LambdaReActAnalysisHandler:
             logger.info(f"⏱️ Total Analysis Time: {analysis_time:.2f} seconds")
             logger.info("-" * 50)
 
-            print(f"analysis_result: {analysis_result}")
+            logger.debug("analysis_result: %s", analysis_result)
             
             # Analysis Result Processing
             if analysis_result.get('success'):
@@ -1,18 +1,91 @@
 # src/agent/prompts/__init__.py
 
 import os
+import logging
 import yaml
 import re
+import functools
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Union
 from langchain_core.messages import SystemMessage, HumanMessage
 
+logger = logging.getLogger(__name__)
+
+# libyaml(C) 로더가 있으면 사용하고, 없으면 순수 Python SafeLoader로 대체
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# 조건부 블록 {{#if condition}}...{{else}}...{{/if}} 패턴
+_CONDITIONAL_BLOCK_RE = re.compile(r'{{#if (\w+)}}(.*?)(?:{{else}}(.*?))?{{/if}}', re.DOTALL)
+# 단일 중괄호 플레이스홀더 {VARIABLE} 패턴 (이중 중괄호 {{VARIABLE}}의 안쪽 중괄호는 제외)
+_SINGLE_BRACE_RE = re.compile(r'(?<!{){(?!{)[^{}]+}(?!})')
+# 컴파일용 토큰 패턴: 조건부 블록 또는 {{VARIABLE}}
+_TEMPLATE_TOKEN_RE = re.compile(
+    r'{{#if (\w+)}}(.*?)(?:{{else}}(.*?))?{{/if}}|{{([^{}]+)}}', re.DOTALL
+)
+
+# 컴파일된 템플릿 세그먼트 종류
+_LITERAL, _VARIABLE, _CONDITIONAL = 0, 1, 2
+
+
+def _compile_template(text: str) -> List[tuple]:
+    """
+    템플릿 문자열을 세그먼트 리스트로 컴파일
+    
+    세그먼트: (_LITERAL, 텍스트) / (_VARIABLE, 변수명, 원문) /
+             (_CONDITIONAL, 조건 변수명, if 세그먼트, else 세그먼트)
+    """
+    segments = []
+    pos = 0
+    for match in _TEMPLATE_TOKEN_RE.finditer(text):
+        if match.start() > pos:
+            segments.append((_LITERAL, text[pos:match.start()]))
+        if match.group(1) is not None:
+            segments.append((
+                _CONDITIONAL,
+                match.group(1),
+                _compile_template(match.group(2)),
+                _compile_template(match.group(3) or '')
+            ))
+        else:
+            segments.append((_VARIABLE, match.group(4), match.group(0)))
+        pos = match.end()
+    if pos < len(text):
+        segments.append((_LITERAL, text[pos:]))
+    return segments
+
+
+def _render_template(segments: List[tuple], context: Dict[str, Any]) -> str:
+    """컴파일된 세그먼트를 컨텍스트로 렌더링 (정규식/format 파싱 없음)"""
+    parts = []
+    for segment in segments:
+        kind = segment[0]
+        if kind == _LITERAL:
+            parts.append(segment[1])
+        elif kind == _VARIABLE:
+            # 컨텍스트에 없는 변수는 원문 그대로 유지
+            name = segment[1]
+            parts.append(str(context[name]) if name in context else segment[2])
+        elif context.get(segment[1]):
+            parts.append(_render_template(segment[2], context))
+        else:
+            parts.append(_render_template(segment[3], context))
+    return "".join(parts)
+
+
 class PromptLoader:
     """YAML 파일에서 프롬프트를 로드하는 클래스"""
     
+    # (이름, 변형)별 로드 결과 캐시 최대 항목 수 (LRU)
+    PROMPT_CACHE_SIZE = 128
+    
     def __init__(self, prompts_dir: Union[str, Path]):
         self.prompts_dir = Path(prompts_dir)
-        self.prompts_cache = {}
+        # (이름, 변형) -> 로드된 프롬프트 데이터 (인스턴스별 LRU 캐시)
+        self._load_prompt_cached = functools.lru_cache(maxsize=self.PROMPT_CACHE_SIZE)(self._load_prompt)
+        # 파일 경로 -> 파싱된 YAML 데이터 (같은 파일의 변형끼리 공유)
+        self.files_cache = {}
+        # 템플릿 원문 -> 컴파일된 세그먼트 (단일 중괄호 템플릿은 None)
+        self.templates_cache = {}
     
     def load_prompt(self, name: str, variant: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -25,13 +98,16 @@ class PromptLoader:
         Returns:
             Dict: 로드된 프롬프트 데이터
         """
-        # 캐시 키 생성
-        cache_key = f"{name}_{variant or 'default'}"
-        
-        # 이미 캐시된 프롬프트가 있으면 반환
-        if cache_key in self.prompts_cache:
-            return self.prompts_cache[cache_key]
-        
+        return self._load_prompt_cached(name, variant)
+    
+    def clear_cache(self):
+        """로드/파싱/컴파일 캐시 초기화"""
+        self._load_prompt_cached.cache_clear()
+        self.files_cache.clear()
+        self.templates_cache.clear()
+    
+    def _load_prompt(self, name: str, variant: Optional[str]) -> Dict[str, Any]:
+        """프롬프트 YAML 파일을 실제로 읽고 변형을 적용 (load_prompt의 캐시 대상)"""
         # 기본 프롬프트 파일 경로
         file_path = self.prompts_dir / f"{name}.yaml"
         
@@ -45,9 +121,8 @@ class PromptLoader:
         if not file_path.exists():
             raise FileNotFoundError(f"Prompt file not found: {file_path}")
         
-        # YAML 파일 로드
-        with open(file_path, 'r', encoding='utf-8') as file:
-            prompt_data = yaml.safe_load(file)
+        # YAML 파일 로드 (같은 파일의 여러 변형은 한 번만 파싱)
+        prompt_data = self._read_yaml(file_path)
         
         # 변형 적용
         if variant and "variants" in prompt_data and variant in prompt_data["variants"]:
@@ -67,10 +142,26 @@ class PromptLoader:
         if "variants" in prompt_data:
             del prompt_data["variants"]
         
-        # 캐시에 저장
-        self.prompts_cache[cache_key] = prompt_data
         return prompt_data
     
+    def _read_yaml(self, file_path: Path) -> Dict[str, Any]:
+        """
+        YAML 파일 파싱 결과 반환 (경로 기준 캐시, 같은 파일의 여러 변형은 한 번만 파싱)
+        
+        파일 변경은 감지하지 않음 - 다시 읽으려면 clear_cache() 호출.
+        변형 병합이 최상위 키를 수정하므로 얕은 복사본을 반환
+        """
+        cached = self.files_cache.get(file_path)
+        if cached is not None:
+            return dict(cached)
+        
+        # 바이너리로 열어 libyaml이 UTF-8 디코딩을 직접 처리하도록 함
+        with open(file_path, 'rb') as file:
+            data = yaml.load(file, Loader=_YamlLoader)
+        
+        self.files_cache[file_path] = data
+        return dict(data)
+    
     def format_prompt(self, prompt_data: Dict[str, Any], **kwargs) -> Dict[str, Any]:
         """
         프롬프트 데이터의 템플릿 필드를 포맷팅
@@ -93,6 +184,13 @@ class PromptLoader:
         # 조건부 블록 및 변수 포맷팅 처리
         for key, value in prompt_data.items():
             if isinstance(value, str):
+                # 컴파일된 템플릿이 있으면 세그먼트 렌더링으로 처리
+                segments = self._get_compiled_template(value)
+                if segments is not None:
+                    result[key] = _render_template(segments, kwargs)
+                    continue
+                
+                # 단일 중괄호 템플릿은 기존 방식으로 처리
                 # 조건부 블록 처리
                 processed_value = self._process_conditional_blocks(value, kwargs)
                 
@@ -103,7 +201,7 @@ class PromptLoader:
                 try:
                     # 일반 변수 대체 ({VARIABLE} 형식) - 템플릿에 실제 단일 중괄호 플레이스홀더가 있을 때만 수행
                     # 원본 값 기준으로 단일 중괄호 패턴 존재 여부 확인 (이중 중괄호는 제외)
-                    if re.search(r'{(?!{)[^{}]+}', value):
+                    if _SINGLE_BRACE_RE.search(value):
                         result[key] = processed_value.format(**kwargs)
                     else:
                         # 단일 중괄호 플레이스홀더가 없다면, 이미 {{VAR}} 치환만으로 충분하므로 그대로 사용
@@ -116,6 +214,19 @@ class PromptLoader:
         
         return result
     
+    def _get_compiled_template(self, text: str) -> Optional[List[tuple]]:
+        """
+        템플릿 문자열의 컴파일 결과 반환 (최초 1회만 컴파일)
+        
+        단일 중괄호 플레이스홀더가 있는 템플릿은 str.format 의미를 유지해야 하므로 None 반환
+        """
+        if text in self.templates_cache:
+            return self.templates_cache[text]
+        
+        segments = None if _SINGLE_BRACE_RE.search(text) else _compile_template(text)
+        self.templates_cache[text] = segments
+        return segments
+    
     def _process_conditional_blocks(self, text: str, context: Dict[str, Any]) -> str:
         """
         조건부 블록 {{#if condition}}...{{else}}...{{/if}} 처리
@@ -127,9 +238,6 @@ class PromptLoader:
         Returns:
             str: 조건부 블록이 처리된 텍스트
         """
-        # if 블록 찾기
-        pattern = r'{{#if (\w+)}}(.*?)(?:{{else}}(.*?))?{{/if}}'
-        
         def replace_conditional(match):
             condition_var = match.group(1)
             if_content = match.group(2)
@@ -142,7 +250,7 @@ class PromptLoader:
                 return else_content
         
         # 모든 조건부 블록 처리
-        return re.sub(pattern, replace_conditional, text, flags=re.DOTALL)
+        return _CONDITIONAL_BLOCK_RE.sub(replace_conditional, text)
 
 
 class PromptManager:
@@ -151,6 +259,19 @@ class PromptManager:
     def __init__(self, prompts_dir: Union[str, Path]):
         self.loader = PromptLoader(prompts_dir)
         self.current_variants = {}  
+        self._preload_prompts()
+    
+    def _preload_prompts(self):
+        """
+        프롬프트 디렉토리의 모든 YAML을 미리 로드
+        
+        Lambda 초기화 단계에서 파싱을 끝내 첫 요청의 지연을 줄임
+        """
+        for path in self.loader.prompts_dir.glob("*.yaml"):
+            try:
+                self.loader.load_prompt(path.stem)
+            except Exception as e:
+                logger.warning(f"⚠️ 프롬프트 미리 로드 실패 ({path.name}): {str(e)}")
     
     def get_prompt(self, name: str, variant: Optional[str] = None, **kwargs) -> Dict[str, Any]:
         """
@@ -175,7 +296,7 @@ class PromptManager:
         if variant:
             self.current_variants[name] = variant
         
-        # 프롬프트 포맷팅
+        # 프롬프트 포맷팅 (템플릿 컴파일 결과는 loader에서 재사용)
         return self.loader.format_prompt(prompt_data, **kwargs)
     
     def set_variant(self, name: str, variant: Optional[str] = None):
@@ -224,7 +345,7 @@ class PromptManager:
 
     def clear_cache(self):
         """프롬프트 캐시 초기화"""
-        self.loader.prompts_cache.clear()
+        self.loader.clear_cache()
         
     def toggle_variant(self, name: str, variant: str, condition: bool):
         """
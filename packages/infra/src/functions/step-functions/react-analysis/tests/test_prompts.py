@@ -0,0 +1,86 @@
+"""
+프롬프트 템플릿 렌더링 테스트
+"""
+import re
+from pathlib import Path
+
+from prompts import PromptLoader, PromptManager
+
+PROMPTS_DIR = Path(__file__).resolve().parent.parent / "prompts"
+
+# 기존 format_prompt가 사용하던 단일 중괄호 판별 패턴
+_LEGACY_SINGLE_BRACE_RE = re.compile(r'{(?!{)[^{}]+}')
+
+
+def _legacy_format(loader: PromptLoader, value: str, **kwargs) -> str:
+    """컴파일 경로 도입 전의 조건부 블록 처리 + 치환 + str.format 방식"""
+    processed_value = loader._process_conditional_blocks(value, kwargs)
+    for var_name, var_value in kwargs.items():
+        processed_value = processed_value.replace(f"{{{{{var_name}}}}}", str(var_value))
+    try:
+        if _LEGACY_SINGLE_BRACE_RE.search(value):
+            return processed_value.format(**kwargs)
+        return processed_value
+    except (KeyError, ValueError):
+        return processed_value
+
+
+def test_double_brace_templates_use_compiled_path():
+    loader = PromptLoader(PROMPTS_DIR)
+
+    assert loader._get_compiled_template("Hello {{NAME}}") is not None
+    assert loader._get_compiled_template("{{#if X}}a{{else}}b{{/if}}") is not None
+    # 단일 중괄호 플레이스홀더는 str.format 의미를 유지하기 위해 기존 방식 사용
+    assert loader._get_compiled_template("Hello {NAME}") is None
+    assert loader._get_compiled_template("{{A}} and {B}") is None
+
+
+def test_agent_profile_matches_legacy_rendering():
+    manager = PromptManager(PROMPTS_DIR)
+    variables = {
+        "DATETIME": "2025-01-01T00:00:00+00:00",
+        "INDEX_ID": "test-index",
+        "QUERY": "도면의 치수를 분석해줘",
+        "PREVIOUS_ANALYSIS": "이전 분석 결과 없음",
+        "REFERENCES": "참조 정보 없음",
+        "MEDIA_TYPE": "DOCUMENT",
+    }
+
+    prompt_data = manager.loader.load_prompt("agent_profile")
+    rendered = manager.get_prompt("agent_profile", **variables)
+
+    for key in ("system_prompt", "instruction"):
+        template = prompt_data[key]
+        assert manager.loader._get_compiled_template(template) is not None
+        assert rendered[key] == _legacy_format(manager.loader, template, **variables)
+        assert "{{" not in rendered[key]
+
+
+def test_conditional_template_matches_legacy_rendering():
+    loader = PromptLoader(PROMPTS_DIR)
+    template = (
+        "Query: {{QUERY}}\n"
+        "{{#if PREVIOUS_ANALYSIS}}Previous: {{PREVIOUS_ANALYSIS}}{{else}}No previous analysis{{/if}}\n"
+        "{{#if REFERENCES}}Refs: {{REFERENCES}}{{/if}}"
+    )
+    prompt_data = {"instruction": template}
+
+    for variables in (
+        {"QUERY": "q", "PREVIOUS_ANALYSIS": "done", "REFERENCES": "r1"},
+        {"QUERY": "q", "PREVIOUS_ANALYSIS": "", "REFERENCES": ""},
+    ):
+        rendered = loader.format_prompt(prompt_data, **variables)["instruction"]
+        assert rendered == _legacy_format(loader, template, **variables)
+
+
+def test_values_with_braces_are_inserted_verbatim():
+    loader = PromptLoader(PROMPTS_DIR)
+    analysis = '{"page": 1, "items": [{"label": "{DATETIME}"}]}'
+
+    rendered = loader.format_prompt(
+        {"instruction": "Context: {{PREVIOUS_ANALYSIS}} at {{DATETIME}}"},
+        PREVIOUS_ANALYSIS=analysis,
+        DATETIME="now"
+    )["instruction"]
+
+    assert rendered == f"Context: {analysis} at now"
@@ -36,11 +36,15 @@ class ReactorNode:
         
         # Load available tools
         self.tools = get_all_tools()
+        self._tool_descriptions: Optional[str] = None
         
         logger.info(f"✅ VisionReactorNode initialized with {len(self.tools)} tools")
     
     def _get_tool_descriptions(self) -> str:
-        """Generate dynamic tool descriptions"""
+        """Generate dynamic tool descriptions (built once; the tool set is fixed per node)"""
+        if self._tool_descriptions is not None:
+            return self._tool_descriptions
+
         tool_descriptions = []
         for tool in self.tools:
             # Get tool name from class name
@@ -78,7 +82,8 @@ class ReactorNode:
             
             tool_descriptions.append(f"{tool_name}: {description}")
         
-        return "\n".join(tool_descriptions)
+        self._tool_descriptions = "\n".join(tool_descriptions)
+        return self._tool_descriptions
     
     def __call__(self, state: AgentState) -> AgentState:
         """Process current state and decide next action"""